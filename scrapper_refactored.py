@@ -2,7 +2,7 @@
 Sistema de gerenciamento de audiências para escritório de advocacia.
 
 Responsável por:
-1. Autenticar nos sistemas de tribunais (TRT2 e TRT15) com suporte a 2FA
+1. Autenticar nos sistemas de tribunais (TRT2, TRT15 e demais instâncias do PJe configuradas) com suporte a 2FA
 2. Extrair informações de audiências agendadas
 3. Sincronizar com planilhas Google
 4. Atualizar eventos no Google Calendar
@@ -14,19 +14,29 @@ Data: Novembro 2025
 """
 
 from __future__ import annotations
-from datetime import datetime, timedelta
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
+from datetime import date, datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+import asyncio
+import base64
+import codecs
+import gzip
+import hashlib
 import json
 import logging
 import os
+import re
 import smtplib
 import sys
+import threading
 import time
 from email.mime.text import MIMEText
+from http.cookies import Morsel
 from logging.handlers import RotatingFileHandler, SysLogHandler
 
-import pandas as pd
 import requests
 from dotenv import load_dotenv
 from google.api_core import retry
@@ -41,9 +51,29 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from tenacity import retry as tenacity_retry
-from tenacity import stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import (
+    AsyncRetrying, stop_after_attempt, stop_after_delay, wait_exponential, retry_if_exception_type
+)
 import chromedriver_autoinstaller
 
+try:
+    import aiohttp
+    from yarl import URL
+except ImportError:  # Dependência opcional, necessária apenas com HTTP_BACKEND=async
+    aiohttp = None
+
+# O pandas só é importado quando o backend de dados 'pandas' é usado (ver load_pandas)
+pd = None
+
+
+def load_pandas():
+    """Importa o pandas na primeira utilização e o disponibiliza como 'pd' no módulo."""
+    global pd
+    if pd is None:
+        import pandas
+        pd = pandas
+    return pd
+
 # Carrega variáveis de ambiente
 load_dotenv()
 
@@ -96,6 +126,69 @@ class Config:
     # Cache de Tokens
     TOKEN_CACHE_FILE: str = os.getenv('TOKEN_CACHE_FILE', './session_tokens.json')
     TOKEN_EXPIRY_HOURS: int = int(os.getenv('TOKEN_EXPIRY_HOURS', '24'))
+    SESSION_KEEPALIVE_MINUTES: int = int(os.getenv('SESSION_KEEPALIVE_MINUTES', '10'))
+    SESSION_VALIDATION_TTL_MINUTES: int = int(os.getenv('SESSION_VALIDATION_TTL_MINUTES', '10'))
+    
+    # Login único no SSO do PDPJ, compartilhado entre os tribunais
+    SSO_LOGIN_ENABLED: bool = os.getenv('SSO_LOGIN_ENABLED', 'true').lower() == 'true'
+    SSO_REDIRECT_TIMEOUT: int = int(os.getenv('SSO_REDIRECT_TIMEOUT', '30'))
+    SSO_HOST: str = os.getenv('SSO_HOST', 'sso.cloud.pje.jus.br')
+    SSO_REALM: str = os.getenv('SSO_REALM', 'pje')
+    # Renova as sessões vencidas sem navegador (refresh token ou cookie do SSO)
+    SSO_REFRESH_ENABLED: bool = os.getenv('SSO_REFRESH_ENABLED', 'true').lower() == 'true'
+    
+    # Navegador do login: perfil reutilizável e bloqueio de imagens, fontes e analytics
+    CHROME_PROFILE_DIR: str = os.getenv('CHROME_PROFILE_DIR', './cache/chrome-profile')
+    LOGIN_BLOCK_RESOURCES: bool = os.getenv('LOGIN_BLOCK_RESOURCES', 'true').lower() == 'true'
+    
+    # ChromeDriver: cache local por versão do Chrome ou caminho fixo (sem verificações)
+    CHROMEDRIVER_CACHE_DIR: str = os.getenv('CHROMEDRIVER_CACHE_DIR', './cache/chromedriver')
+    CHROMEDRIVER_PATH: str = os.getenv('CHROMEDRIVER_PATH', '')
+    
+    # Cache de respostas da API dos tribunais
+    RESPONSE_CACHE_ENABLED: bool = os.getenv('RESPONSE_CACHE_ENABLED', 'true').lower() == 'true'
+    RESPONSE_CACHE_DIR: str = os.getenv('RESPONSE_CACHE_DIR', './cache/responses')
+    RESPONSE_CACHE_NEAR_TTL_MINUTES: int = int(os.getenv('RESPONSE_CACHE_NEAR_TTL_MINUTES', '0'))
+    RESPONSE_CACHE_FAR_TTL_HOURS: int = int(os.getenv('RESPONSE_CACHE_FAR_TTL_HOURS', '24'))
+    RESPONSE_CACHE_FAR_DAYS: int = int(os.getenv('RESPONSE_CACHE_FAR_DAYS', '180'))
+    
+    # Política de atualização das janelas de datas
+    REFRESH_MODE: str = os.getenv('REFRESH_MODE', 'full').lower()
+    REFRESH_STATE_FILE: str = os.getenv('REFRESH_STATE_FILE', './cache/refresh_state.json')
+    REFRESH_HOT_DAYS: int = int(os.getenv('REFRESH_HOT_DAYS', '30'))
+    REFRESH_HOT_MINUTES: int = int(os.getenv('REFRESH_HOT_MINUTES', '15'))
+    REFRESH_WARM_DAYS: int = int(os.getenv('REFRESH_WARM_DAYS', '180'))
+    REFRESH_WARM_HOURS: int = int(os.getenv('REFRESH_WARM_HOURS', '6'))
+    REFRESH_COLD_HOURS: int = int(os.getenv('REFRESH_COLD_HOURS', '24'))
+    
+    # Tribunais consultados: NOME ou NOME=dominio/instancia, separados por vírgula
+    TRIBUNALS: str = os.getenv('TRIBUNALS', 'TRT2,TRT15')
+    MAX_PARALLEL_TRIBUNALS: int = int(os.getenv('MAX_PARALLEL_TRIBUNALS', '4'))
+    MAX_PARALLEL_LOGINS: int = int(os.getenv('MAX_PARALLEL_LOGINS', '4'))
+    
+    # Coleta de audiências
+    FUTURE_YEARS: int = int(os.getenv('FUTURE_YEARS', '3'))
+    MAX_CONCURRENT_REQUESTS_PER_TRIBUNAL: int = int(
+        os.getenv('MAX_CONCURRENT_REQUESTS_PER_TRIBUNAL', '4')
+    )
+    RATE_LIMIT_PER_SECOND: float = float(os.getenv('RATE_LIMIT_PER_SECOND', '5'))
+    RATE_LIMIT_BURST: int = int(os.getenv('RATE_LIMIT_BURST', '5'))
+    RATE_LIMIT_LATENCY_FACTOR: float = float(os.getenv('RATE_LIMIT_LATENCY_FACTOR', '2.0'))
+    HEARINGS_PAGE_SIZE: int = int(os.getenv('HEARINGS_PAGE_SIZE', '500'))
+    WINDOW_SPLIT_THRESHOLD: int = int(os.getenv('WINDOW_SPLIT_THRESHOLD', '1500'))
+    PROBE_BEFORE_FETCH: bool = os.getenv('PROBE_BEFORE_FETCH', 'true').lower() == 'true'
+    HTTP_BACKEND: str = os.getenv('HTTP_BACKEND', 'threads').lower()
+    STREAMING_JSON: bool = os.getenv('STREAMING_JSON', 'true').lower() == 'true'
+    DATA_BACKEND: str = os.getenv('DATA_BACKEND', 'pandas').lower()
+    
+    # Limites de tempo e disjuntor por tribunal
+    REQUEST_TIMEOUT_SECONDS: int = int(os.getenv('REQUEST_TIMEOUT_SECONDS', '30'))
+    REQUEST_DEADLINE_SECONDS: int = int(os.getenv('REQUEST_DEADLINE_SECONDS', '60'))
+    CIRCUIT_BREAKER_FAILURES: int = int(os.getenv('CIRCUIT_BREAKER_FAILURES', '3'))
+    
+    # Orçamento de tempo da execução (0 = sem limite) e janela prioritária
+    RUN_BUDGET_SECONDS: int = int(os.getenv('RUN_BUDGET_SECONDS', '1200'))
+    PRIORITY_DAYS: int = int(os.getenv('PRIORITY_DAYS', '30'))
     
     @classmethod
     def validate(cls) -> bool:
@@ -116,6 +209,69 @@ class Config:
             return False
         
         return True
+    
+    @classmethod
+    def get_tribunals(cls) -> List[Tribunal]:
+        """
+        Monta o registro de tribunais a partir de TRIBUNALS.
+        
+        Cada entrada é o nome do tribunal (ex.: TRT2), que usa o domínio
+        pje.<nome>.jus.br e a instância primeirograu, ou NOME=dominio/instancia
+        para instâncias com endereço próprio (ex.: TRT2-2G=pje.trt2.jus.br/segundograu).
+        """
+        tribunals = []
+        for entry in cls.TRIBUNALS.split(','):
+            entry = entry.strip()
+            if not entry:
+                continue
+            
+            name, _, location = entry.partition('=')
+            name = name.strip().upper()
+            domain, _, instance = location.strip().partition('/')
+            tribunals.append(Tribunal(
+                name=name,
+                domain=domain or f'pje.{name.lower()}.jus.br',
+                instance=instance or 'primeirograu'
+            ))
+        return tribunals
+
+
+class Tribunal(NamedTuple):
+    """Instância do PJe consultada pelo sistema."""
+    
+    name: str
+    domain: str
+    instance: str = 'primeirograu'
+    
+    @property
+    def base_url(self) -> str:
+        """URL da instância do PJe."""
+        return f'https://{self.domain}/{self.instance}/'
+    
+    @property
+    def login_url(self) -> str:
+        """URL da página de login."""
+        return f'{self.base_url}login.seam'
+    
+    @property
+    def api_url(self) -> str:
+        """URL da API de pauta de audiências."""
+        return f'https://{self.domain}/pje-comum-api/api/pauta-usuarios-externos'
+
+
+class FetchWindow(NamedTuple):
+    """Janela de datas de um tribunal a ser consultada na API de pauta."""
+    
+    tribunal: Tribunal
+    label: str
+    start_date: date
+    end_date: date
+    prefer_cache: bool = False
+    
+    @property
+    def key(self) -> str:
+        """Identificador estável da janela (tribunal e período) usado no histórico de atualizações."""
+        return f'{self.tribunal.name}|{self.start_date.isoformat()}|{self.end_date.isoformat()}'
 
 
 class HearingLogger:
@@ -230,27 +386,37 @@ class EmailNotifier:
 class TokenCache:
     """Gerenciador de cache de tokens de autenticação."""
     
+    # Serializa escritas no arquivo de cache entre sessões executadas em paralelo
+    _lock = threading.Lock()
+    
+    # Entrada com as credenciais do SSO do PDPJ, compartilhadas entre os tribunais
+    SSO_KEY: str = '_sso_pdpj'
+    # Duração observada das sessões de cada tribunal, em horas
+    LIFETIME_KEY: str = '_duracao_sessoes'
+    
     def __init__(self, cache_file: str = None, logger: Optional[HearingLogger] = None):
         """Inicializa o gerenciador de cache."""
         self.cache_file = Path(cache_file or Config.TOKEN_CACHE_FILE)
         self.logger = logger or HearingLogger()
         
-    def save_tokens(self, tribunal: str, cookies: List[Dict]) -> None:
-        """Salva tokens de um tribunal no cache."""
+    def save_tokens(self, tribunal: str, cookies: List[Dict], access_token: Optional[str] = None) -> None:
+        """Salva tokens de um tribunal no cache (e o access token usado no header Authorization, se houver)."""
         try:
-            cache_data = self._load_cache()
-            
-            cache_data[tribunal] = {
-                'cookies': cookies,
-                'timestamp': datetime.now().isoformat(),
-                'expires_at': (
-                    datetime.now() + timedelta(hours=Config.TOKEN_EXPIRY_HOURS)
-                ).isoformat()
-            }
-            
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2, ensure_ascii=False)
+            with self._lock:
+                cache_data = self._load_cache()
                 
+                cache_data[tribunal] = {
+                    'cookies': cookies,
+                    'timestamp': datetime.now().isoformat(),
+                    'expires_at': (
+                        datetime.now() + self._session_lifetime(cache_data, tribunal)
+                    ).isoformat()
+                }
+                if access_token:
+                    cache_data[tribunal]['access_token'] = access_token
+
+                self._write_cache(cache_data)
+
             self.logger.info(f"💾 Tokens salvos em cache para {tribunal}")
         except Exception as e:
             self.logger.error(f"Erro ao salvar tokens: {e}")
@@ -278,6 +444,135 @@ class TokenCache:
             self.logger.error(f"Erro ao carregar tokens: {e}")
             return None
             
+    def load_access_token(self, tribunal: str) -> Optional[str]:
+        """Access token (header Authorization) salvo com a sessão do tribunal, se houver."""
+        return self._load_cache().get(tribunal, {}).get('access_token')
+    
+    def _session_lifetime(self, cache_data: Dict, tribunal: str) -> timedelta:
+        """Validade das sessões do tribunal: a duração observada ou TOKEN_EXPIRY_HOURS."""
+        hours = cache_data.get(self.LIFETIME_KEY, {}).get(tribunal)
+        return timedelta(hours=hours or Config.TOKEN_EXPIRY_HOURS)
+    
+    def expires_at(self, tribunal: str) -> Optional[datetime]:
+        """Momento previsto de expiração da sessão em cache do tribunal."""
+        token_data = self._load_cache().get(tribunal)
+        if not token_data:
+            return None
+        return datetime.fromisoformat(token_data['expires_at'])
+    
+    def touch_tokens(self, tribunal: str, cookies: List[Dict]) -> Optional[datetime]:
+        """
+        Registra que a sessão foi validada agora, atualizando os cookies renovados pelo servidor.
+        
+        A validação renova a sessão no servidor, então a validade da entrada
+        avança para agora + a duração das sessões do tribunal; assim
+        load_tokens continua servindo uma sessão mantida ativa além do prazo
+        calculado no login.
+        
+        Returns:
+            Optional[datetime]: Nova expiração prevista, ou None se o tribunal
+            não está no cache ou a gravação falhou
+        """
+        try:
+            with self._lock:
+                cache_data = self._load_cache()
+                token_data = cache_data.get(tribunal)
+                if not token_data:
+                    return None
+                
+                now = datetime.now()
+                expires_at = max(
+                    datetime.fromisoformat(token_data['expires_at']),
+                    now + self._session_lifetime(cache_data, tribunal)
+                )
+                token_data['cookies'] = cookies
+                token_data['last_validated'] = now.isoformat()
+                token_data['expires_at'] = expires_at.isoformat()
+                
+                self._write_cache(cache_data)
+            return expires_at
+        except Exception as e:
+            self.logger.error(f"Erro ao atualizar tokens: {e}")
+            return None
+    
+    def validated_within(self, tribunal: str, ttl: timedelta) -> bool:
+        """Indica se a sessão em cache do tribunal foi validada (ou usada com sucesso) dentro do TTL."""
+        last_validated = self._load_cache().get(tribunal, {}).get('last_validated')
+        return bool(last_validated) and datetime.now() - datetime.fromisoformat(last_validated) < ttl
+    
+    def record_expiry(self, tribunal: str) -> None:
+        """
+        Registra a duração real de uma sessão que deixou de ser aceita.
+        
+        A duração é o intervalo entre o login e a última validação
+        bem-sucedida; ela passa a definir a validade das próximas sessões.
+        """
+        try:
+            with self._lock:
+                cache_data = self._load_cache()
+                token_data = cache_data.get(tribunal, {})
+                if not token_data.get('last_validated'):
+                    return
+                
+                lifetime = (
+                    datetime.fromisoformat(token_data['last_validated'])
+                    - datetime.fromisoformat(token_data['timestamp'])
+                ).total_seconds() / 3600
+                if lifetime <= 0:
+                    return
+                
+                lifetimes = cache_data.setdefault(self.LIFETIME_KEY, {})
+                previous = lifetimes.get(tribunal)
+                # Suaviza com a observação anterior para não reagir a uma queda isolada
+                lifetimes[tribunal] = round(lifetime if previous is None else (previous + lifetime) / 2, 2)
+                
+                self._write_cache(cache_data)
+            
+            self.logger.info(
+                f"⌛ Sessão do {tribunal} expirou após ~{lifetime:.1f}h "
+                f"(validade considerada: {lifetimes[tribunal]:.1f}h)"
+            )
+        except Exception as e:
+            self.logger.error(f"Erro ao registrar expiração de sessão: {e}")
+    
+    def save_sso_credentials(
+        self,
+        cookies: List[Dict],
+        refresh_token: Optional[str] = None
+    ) -> None:
+        """
+        Salva os cookies do SSO do PDPJ e o refresh token OpenID, se houver.
+        
+        Sem prazo fixo: a validade é verificada ao renovar as sessões.
+        """
+        try:
+            with self._lock:
+                cache_data = self._load_cache()
+                previous = cache_data.get(self.SSO_KEY, {})
+                
+                cache_data[self.SSO_KEY] = {
+                    'cookies': cookies or previous.get('cookies', []),
+                    'refresh_token': refresh_token or previous.get('refresh_token'),
+                    'timestamp': datetime.now().isoformat()
+                }
+                
+                self._write_cache(cache_data)
+            
+            self.logger.debug("💾 Credenciais do SSO salvas em cache")
+        except Exception as e:
+            self.logger.error(f"Erro ao salvar credenciais do SSO: {e}")
+    
+    def load_sso_credentials(self) -> Optional[Dict]:
+        """Carrega os cookies do SSO e o refresh token salvos no último login."""
+        return self._load_cache().get(self.SSO_KEY)
+    
+    def _write_cache(self, cache_data: Dict) -> None:
+        """Grava o arquivo de cache de forma atômica (leituras simultâneas nunca veem um arquivo parcial)."""
+        tmp_path = self.cache_file.with_name(f'{self.cache_file.name}.{threading.get_ident()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache_data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.cache_file)
+    
     def _load_cache(self) -> Dict:
         """Carrega o arquivo de cache."""
         if not self.cache_file.exists():
@@ -293,21 +588,301 @@ class TokenCache:
     def clear_tokens(self, tribunal: str = None) -> None:
         """Limpa tokens do cache (tribunal específico ou todos)."""
         try:
-            if tribunal:
-                cache_data = self._load_cache()
-                if tribunal in cache_data:
-                    del cache_data[tribunal]
-                    with open(self.cache_file, 'w', encoding='utf-8') as f:
-                        json.dump(cache_data, f, indent=2, ensure_ascii=False)
-                    self.logger.info(f"🗑️ Tokens removidos para {tribunal}")
-            else:
-                if self.cache_file.exists():
-                    self.cache_file.unlink()
-                    self.logger.info("🗑️ Cache de tokens completamente limpo")
+            with self._lock:
+                if tribunal:
+                    cache_data = self._load_cache()
+                    if tribunal in cache_data:
+                        del cache_data[tribunal]
+                        self._write_cache(cache_data)
+                        self.logger.info(f"🗑️ Tokens removidos para {tribunal}")
+                else:
+                    if self.cache_file.exists():
+                        self.cache_file.unlink()
+                        self.logger.info("🗑️ Cache de tokens completamente limpo")
         except Exception as e:
             self.logger.error(f"Erro ao limpar cache: {e}")
 
 
+class ResponseCache:
+    """
+    Cache em disco de respostas da API de pauta dos tribunais.
+    
+    Cada entrada tem dois arquivos: o corpo da resposta comprimido
+    ('<chave>.json.gz'), gravado e lido em trechos, e os metadados
+    ('<chave>.meta.json') com ETag, Last-Modified, hash do conteúdo e
+    horário da busca.
+    
+    As entradas de janelas já encerradas ou não atualizadas há mais que o
+    maior intervalo de atualização são removidas na primeira gravação de
+    cada execução (ver prune).
+    """
+    
+    def __init__(self, cache_dir: str = None, logger: Optional[HearingLogger] = None) -> None:
+        """Inicializa o cache no diretório configurado."""
+        self.cache_dir = Path(cache_dir or Config.RESPONSE_CACHE_DIR)
+        self.logger = logger or HearingLogger()
+        self._pruned = False
+        
+    @staticmethod
+    def make_key(tribunal: str, endpoint: str, params: Dict) -> str:
+        """
+        Gera a chave do cache a partir do tribunal, endpoint e parâmetros.
+        
+        A chave começa pela data final da janela (dataFim), o que permite
+        descartar as entradas de janelas encerradas sem abrir os arquivos.
+        """
+        raw = json.dumps([tribunal, endpoint, sorted(params.items())], ensure_ascii=False)
+        return f"{params.get('dataFim', '')}_{hashlib.sha256(raw.encode('utf-8')).hexdigest()}"
+    
+    def prune(self) -> int:
+        """
+        Remove as entradas que não serão mais usadas.
+        
+        Saem as de janelas cuja data final já passou e as gravadas há mais
+        que o maior entre RESPONSE_CACHE_FAR_TTL_HOURS e o intervalo frio
+        dobrado do RefreshScheduler (2 × REFRESH_COLD_HOURS, dado às janelas
+        que nunca mudam), incluindo chaves de formatos antigos e arquivos
+        temporários perdidos.
+        
+        Returns:
+            int: Número de arquivos removidos
+        """
+        if not self.cache_dir.exists():
+            return 0
+        
+        today = date.today().isoformat()
+        max_age_hours = max(Config.RESPONSE_CACHE_FAR_TTL_HOURS, 2 * Config.REFRESH_COLD_HOURS)
+        cutoff = time.time() - max_age_hours * 3600
+        removed = 0
+        for path in self.cache_dir.iterdir():
+            if not path.name.endswith(('.json.gz', '.meta.json', '.tmp')):
+                continue
+            window_end = path.name.split('_', 1)[0] if '_' in path.name else ''
+            try:
+                if (window_end and window_end < today) or path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        
+        if removed:
+            self.logger.debug(f"🧹 {removed} respostas antigas removidas do cache")
+        return removed
+    
+    @staticmethod
+    def ttl_for_window(search_start_date: str) -> timedelta:
+        """
+        Define por quanto tempo a resposta de uma janela pode ser servida sem consultar o tribunal.
+        
+        Janelas que começam a mais de RESPONSE_CACHE_FAR_DAYS dias de hoje mudam
+        raramente e usam o TTL longo; as demais usam o TTL curto (0 = sempre revalidar).
+        """
+        try:
+            window_start = datetime.strptime(search_start_date, '%Y-%m-%d')
+        except ValueError:
+            return timedelta(0)
+        
+        if window_start - datetime.now() > timedelta(days=Config.RESPONSE_CACHE_FAR_DAYS):
+            return timedelta(hours=Config.RESPONSE_CACHE_FAR_TTL_HOURS)
+        return timedelta(minutes=Config.RESPONSE_CACHE_NEAR_TTL_MINUTES)
+    
+    # Erros de leitura de um corpo em cache (arquivo ausente, gzip ou JSON corrompido)
+    READ_ERRORS = (OSError, EOFError, ValueError)
+    
+    def _path(self, key: str) -> Path:
+        """Retorna o caminho do corpo comprimido de uma entrada."""
+        return self.cache_dir / f'{key}.json.gz'
+    
+    def _meta_path(self, key: str) -> Path:
+        """Retorna o caminho dos metadados de uma entrada."""
+        return self.cache_dir / f'{key}.meta.json'
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Carrega os metadados de uma entrada ou None se inexistente/corrompida."""
+        meta_path = self._meta_path(key)
+        if not meta_path.exists() or not self._path(key).exists():
+            return None
+        
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Erro ao ler cache de resposta: {e}")
+            return None
+    
+    def iter_body(self, key: str, chunk_size: int = 64 * 1024) -> Iterator[str]:
+        """Lê o corpo de uma entrada em trechos de texto (erros em READ_ERRORS)."""
+        with gzip.open(self._path(key), 'rt', encoding='utf-8') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+    
+    def is_fresh(self, entry: Dict, ttl: timedelta) -> bool:
+        """Indica se a entrada ainda está dentro do TTL."""
+        fetched_at = datetime.fromisoformat(entry['fetched_at'])
+        return datetime.now() - fetched_at < ttl
+    
+    def writer(
+        self,
+        key: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> ResponseCacheWriter:
+        """Abre a gravação em trechos de uma resposta (ver ResponseCacheWriter)."""
+        return ResponseCacheWriter(self, key, etag, last_modified)
+    
+    def put(
+        self,
+        key: str,
+        body: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> Optional[Dict]:
+        """Grava uma resposta já em memória com hash do conteúdo e horário da busca."""
+        writer = self.writer(key, etag, last_modified)
+        writer.write(body)
+        return writer.commit()
+    
+    def touch(self, key: str, entry: Dict) -> None:
+        """Atualiza o horário de uma entrada revalidada pelo servidor (304)."""
+        entry['fetched_at'] = datetime.now().isoformat()
+        try:
+            # O corpo acompanha a idade dos metadados na limpeza (ver prune)
+            os.utime(self._path(key))
+        except OSError:
+            pass
+        self._write_meta(key, entry)
+    
+    def discard(self, key: str) -> None:
+        """Remove uma entrada (por exemplo, com o corpo ilegível)."""
+        for path in (self._meta_path(key), self._path(key)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.warning(f"Erro ao remover cache de resposta: {e}")
+    
+    def _prepare(self) -> None:
+        """Cria o diretório do cache, limpando-o na primeira gravação da execução."""
+        if not self._pruned:
+            self._pruned = True
+            self.prune()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _tmp_path(self, path: Path) -> Path:
+        """Arquivo temporário de uma gravação, exclusivo da thread e do objeto que grava."""
+        return path.with_name(f'{path.name}.{threading.get_ident()}.{id(self)}.tmp')
+    
+    def _commit_body(self, key: str, tmp_path: Path, entry: Dict) -> None:
+        """
+        Publica o corpo gravado em tmp_path e seus metadados.
+        
+        Os metadados antigos saem antes da troca do corpo, de modo que uma
+        interrupção no meio nunca associa o ETag antigo ao corpo novo.
+        """
+        try:
+            self._meta_path(key).unlink()
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, self._path(key))
+        self._write_meta(key, entry)
+    
+    def _write_meta(self, key: str, entry: Dict) -> None:
+        """Grava os metadados de uma entrada de forma atômica."""
+        try:
+            self._prepare()
+            path = self._meta_path(key)
+            tmp_path = self._tmp_path(path)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.logger.warning(f"Erro ao gravar cache de resposta: {e}")
+
+
+class ResponseCacheWriter:
+    """
+    Gravação em trechos de uma resposta no ResponseCache.
+    
+    Os trechos vão comprimidos para um arquivo temporário enquanto o hash do
+    conteúdo é calculado; commit publica o corpo e os metadados de uma vez.
+    Falhas de disco apenas desativam a gravação (a consulta segue normalmente).
+    """
+    
+    def __init__(
+        self,
+        cache: ResponseCache,
+        key: str,
+        etag: Optional[str],
+        last_modified: Optional[str]
+    ) -> None:
+        """Abre o arquivo temporário da entrada."""
+        self.cache = cache
+        self.key = key
+        self.entry = {
+            'content_hash': None,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': datetime.now().isoformat()
+        }
+        self._digest = hashlib.sha256()
+        self._tmp_path: Optional[Path] = None
+        self._file = None
+        try:
+            cache._prepare()
+            self._tmp_path = cache._tmp_path(cache._path(key))
+            self._file = gzip.open(self._tmp_path, 'wt', encoding='utf-8')
+        except Exception as e:
+            self._fail(e)
+    
+    def _fail(self, error: Exception) -> None:
+        """Abandona a gravação após um erro de disco."""
+        self.cache.logger.warning(f"Erro ao gravar cache de resposta: {error}")
+        self.discard()
+    
+    def write(self, chunk: str) -> None:
+        """Acrescenta um trecho do corpo."""
+        if self._file is None:
+            return
+        try:
+            self._file.write(chunk)
+            self._digest.update(chunk.encode('utf-8'))
+        except Exception as e:
+            self._fail(e)
+    
+    def commit(self) -> Optional[Dict]:
+        """Publica a entrada; retorna os metadados gravados ou None se a gravação falhou."""
+        if self._file is None:
+            return None
+        try:
+            self._file.close()
+            self._file = None
+            self.entry['content_hash'] = self._digest.hexdigest()
+            self.cache._commit_body(self.key, self._tmp_path, self.entry)
+            return self.entry
+        except Exception as e:
+            self._fail(e)
+            return None
+    
+    def discard(self) -> None:
+        """Descarta a gravação (resposta inválida ou interrompida)."""
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
+        if self._tmp_path is not None:
+            try:
+                self._tmp_path.unlink()
+            except OSError:
+                pass
+            self._tmp_path = None
+
+
 class GoogleServicesManager:
     """Gerenciador de serviços Google (Sheets e Calendar)."""
     
@@ -373,12 +948,14 @@ class GoogleSheetsManager:
         self, 
         services_manager: GoogleServicesManager,
         notifier: EmailNotifier,
-        logger: Optional[HearingLogger] = None
+        logger: Optional[HearingLogger] = None,
+        processor: Optional[HearingDataProcessor] = None
     ) -> None:
         """Inicializa o gerenciador de Sheets com serviços Google."""
         self.sheet_service = services_manager.sheet_service
         self.notifier = notifier
         self.logger = logger or HearingLogger()
+        self.processor = processor or HearingDataProcessor.create(self.logger)
     
     @tenacity_retry(
         stop=stop_after_attempt(3),
@@ -399,11 +976,9 @@ class GoogleSheetsManager:
             data = result.get('values', [])
             if not data:
                 self.logger.warning("Planilha vazia")
-                return pd.DataFrame()
+                return self.processor.empty_table()
             
-            headers = data[0]
-            values = data[1:] if len(data) > 1 else []
-            df = pd.DataFrame(values, columns=headers)
+            df = self.processor.from_sheet_values(data)
             self.logger.info(f"✅ {len(df)} registros lidos da planilha")
             return df
         
@@ -414,7 +989,7 @@ class GoogleSheetsManager:
         except Exception as e:
             self.logger.error(f"Falha ao ler planilha {spreadsheet_id}: {e}")
             self.notifier.send(f"O sistema não conseguiu ler a planilha. Erro: {e}")
-            return pd.DataFrame()
+            return self.processor.empty_table()
     
     @tenacity_retry(
         stop=stop_after_attempt(3),
@@ -461,9 +1036,9 @@ class GoogleSheetsManager:
             # Cria range dinâmico com base no tamanho do dataframe
             range_name = f'A1:I{len(dataframe) + 1}'
             
-            # Prepara valores com cabeçalhos
-            values = dataframe.values.tolist()
-            values.insert(0, dataframe.columns.tolist())
+            # Prepara valores (no padrão brasileiro) com cabeçalhos
+            values = self.processor.display_rows(dataframe)
+            values.insert(0, list(dataframe.columns))
             
             data = {'values': values}
             
@@ -497,7 +1072,7 @@ class GoogleSheetsManager:
         try:
             self.logger.info(f"➕ Adicionando {len(dataframe)} registros à planilha...")
             range_name = f'A1:I{len(dataframe) + 1}'
-            values = dataframe.values.tolist()
+            values = self.processor.display_rows(dataframe)
             data = {'values': values}
             
             self.sheet_service.spreadsheets().values().append(
@@ -524,12 +1099,14 @@ class GoogleCalendarManager:
         self, 
         services_manager: GoogleServicesManager,
         notifier: EmailNotifier,
-        logger: Optional[HearingLogger] = None
+        logger: Optional[HearingLogger] = None,
+        processor: Optional[HearingDataProcessor] = None
     ) -> None:
         """Inicializa o gerenciador de Calendar com serviços Google."""
         self.calendar_service = services_manager.calendar_service
         self.notifier = notifier
         self.logger = logger or HearingLogger()
+        self.processor = processor or HearingDataProcessor.create(self.logger)
     
     @tenacity_retry(
         stop=stop_after_attempt(3),
@@ -565,11 +1142,22 @@ class GoogleCalendarManager:
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=20)
     )
-    def create_event(self, row_values: List[str], calendar_id: str) -> None:
-        """Cria um evento de audiência no calendário."""
+    def create_event(
+        self,
+        row_values: List[str],
+        calendar_id: str,
+        start: Optional[datetime] = None
+    ) -> None:
+        """
+        Cria um evento de audiência no calendário.
+        
+        row_values são os campos já formatados como texto; start é o início
+        da audiência, lido da data e hora quando não informado.
+        """
         try:
-            date_str = f'{row_values[0]} {row_values[1]}'
-            start_date_obj = datetime.strptime(date_str, '%d/%m/%Y %H:%M:%S')
+            start_date_obj = start or datetime.strptime(
+                f'{row_values[0]} {row_values[1]}', '%d/%m/%Y %H:%M:%S'
+            )
             end_date_obj = start_date_obj + timedelta(hours=1)
             
             event_summary = f'{row_values[6]} - {row_values[3]} x {row_values[4]} {row_values[0]} às {row_values[1]} - {row_values[5]}'
@@ -644,8 +1232,19 @@ class GoogleCalendarManager:
             self.logger.error(f"Falha ao buscar eventos com resumo '{summary}': {e}")
             return []
     
-    def populate_calendar(self, dataframe: pd.DataFrame, calendar_id: str) -> None:
-        """Popula o calendário com eventos baseados nos dados do DataFrame."""
+    def populate_calendar(
+        self,
+        dataframe: pd.DataFrame,
+        calendar_id: str,
+        budget: Optional[RunBudget] = None
+    ) -> None:
+        """
+        Popula o calendário com eventos baseados nos dados do DataFrame.
+        
+        As audiências são processadas na ordem do DataFrame (por data). Se o
+        orçamento da execução se esgotar, os eventos restantes ficam para a
+        próxima execução, que cria os que ainda não existirem.
+        """
         if dataframe.empty:
             self.logger.error("Tentativa de popular calendário com DataFrame vazio")
             self.notifier.send("Tentativa de popular calendário com dados vazios. Verifique o código.")
@@ -654,13 +1253,21 @@ class GoogleCalendarManager:
         self.logger.info(f"📅 Sincronizando {len(dataframe)} audiências com o calendário...")
         event_summaries = self.get_event_summaries(calendar_id)
         created_count = 0
+        rows = self.processor.display_rows(dataframe)
+        starts = self.processor.start_times(dataframe)
         
-        for _, row in dataframe.iterrows():
-            row_values = row.values
+        for position, (row_values, start) in enumerate(zip(rows, starts)):
+            if budget and budget.expired:
+                self.logger.warning(
+                    f"⏳ Orçamento de tempo esgotado: {len(dataframe) - position} audiências "
+                    f"ficam para a próxima sincronização do calendário"
+                )
+                break
+            
             event_summary = f'{row_values[6]} - {row_values[3]} x {row_values[4]} {row_values[0]} às {row_values[1]} - {row_values[5]}'
             
             if event_summary not in event_summaries:
-                self.create_event(row_values, calendar_id)
+                self.create_event(row_values, calendar_id, start)
                 created_count += 1
         
         self.logger.info(f"✅ {created_count} novos eventos criados no calendário")
@@ -672,8 +1279,7 @@ class GoogleCalendarManager:
         
         self.logger.info(f"🔄 Processando {len(diff_dataframe)} audiências alteradas...")
         
-        for _, row in diff_dataframe.iterrows():
-            row_values = row.values
+        for row_values in self.processor.display_rows(diff_dataframe):
             event_summary = f'{row_values[6]} - {row_values[3]} x {row_values[4]} {row_values[0]} às {row_values[1]} - {row_values[5]}'
             
             events = self.find_events_by_summary(event_summary, calendar_id)
@@ -694,397 +1300,3155 @@ class GoogleCalendarManager:
                     )
 
 
-class CourtSession:
-    """Gerenciador de sessão para acesso aos tribunais com suporte a 2FA."""
+class AdaptiveRateLimiter:
+    """
+    Limitador de requisições de um tribunal.
+    
+    Combina um token bucket (RATE_LIMIT_PER_SECOND, com rajadas de até
+    RATE_LIMIT_BURST; 0 = sem limite de taxa) com um limite de concorrência AIMD: o limite cresce
+    aditivamente enquanto as respostas chegam rápidas e é reduzido à metade
+    em respostas 429/5xx, falhas de rede ou quando a latência média sobe além
+    de RATE_LIMIT_LATENCY_FACTOR vezes a latência de referência.
+    """
     
     def __init__(
         self,
         tribunal_name: str,
-        logger: Optional[HearingLogger] = None,
-        notifier: Optional[EmailNotifier] = None
+        max_concurrency: Optional[int] = None,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        logger: Optional[HearingLogger] = None
     ) -> None:
-        """Inicializa o gerenciador de sessão com headers padrão."""
+        """Inicializa o limitador com concorrência 1 e o bucket cheio."""
         self.tribunal_name = tribunal_name
-        self.session = requests.Session()
+        self.max_concurrency = max(1, max_concurrency or Config.MAX_CONCURRENT_REQUESTS_PER_TRIBUNAL)
+        self.rate = rate if rate is not None else Config.RATE_LIMIT_PER_SECOND
+        self.burst = max(1, burst or Config.RATE_LIMIT_BURST)
         self.logger = logger or HearingLogger()
-        self.notifier = notifier or EmailNotifier()
-        self.token_cache = TokenCache(logger=self.logger)
-        self._set_headers()
         
-    def _set_headers(self) -> None:
-        """Define headers padrão para a sessão."""
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
-        self.session.headers.update(headers)
+        self.limit = 1.0
+        self.in_flight = 0
+        self.tokens = float(self.burst)
+        self.latency_avg: Optional[float] = None
+        self.latency_baseline: Optional[float] = None
+        self.decreases = 0
+        self.samples = 0
+        self._last_refill = time.monotonic()
+        self._last_decrease = 0.0
+        self._blocked_until = 0.0
+        self._cond = threading.Condition()
     
-    def login_interactive(self, login_url: str, timeout: int = 300) -> bool:
+    def _refill(self, now: float) -> None:
+        """Repõe os tokens proporcionalmente ao tempo decorrido."""
+        self.tokens = min(self.burst, self.tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+    
+    def _try_acquire(self) -> float:
         """
-        Realiza login interativo no sistema do tribunal com suporte a 2FA.
-        
-        Abre o navegador Chrome de forma visível para que o usuário possa:
-        1. Inserir credenciais manualmente
-        2. Completar o segundo fator de autenticação (2FA)
-        3. Aguarda até que o login seja concluído
-        4. Captura e salva os cookies/tokens para uso posterior
+        Tenta reservar uma vaga para uma requisição.
         
-        Args:
-            login_url: URL da página de login do tribunal
-            timeout: Tempo máximo em segundos para aguardar o login (padrão: 300s = 5 minutos)
-            
         Returns:
-            bool: True se o login foi bem-sucedido, False caso contrário
+            float: 0 se a vaga foi reservada ou o tempo sugerido de espera em segundos
         """
-        # Tenta carregar tokens do cache primeiro
-        cached_cookies = self.token_cache.load_tokens(self.tribunal_name)
-        if cached_cookies:
-            self.logger.info(f"🔑 Usando tokens em cache para {self.tribunal_name}")
-            for cookie in cached_cookies:
-                self.session.cookies.set(
-                    cookie['name'],
-                    cookie['value'],
-                    domain=cookie.get('domain', '')
-                )
-            # Valida se os tokens ainda funcionam
-            if self._validate_session():
-                return True
-            else:
-                self.logger.warning("⚠️ Tokens em cache inválidos, realizando novo login")
-                self.token_cache.clear_tokens(self.tribunal_name)
+        now = time.monotonic()
+        self._refill(now)
         
-        try:
-            self.logger.info(f"🌐 Iniciando login interativo para {self.tribunal_name}")
-            self.logger.info(f"🔗 URL: {login_url}")
-            
-            # Configuração do Chrome - MODO VISÍVEL para interação manual
-            chrome_opts = ChromeOptions()
-            # Removido --headless para permitir interação visual
-            chrome_opts.add_argument("--start-maximized")
-            chrome_opts.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_opts.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_opts.add_experimental_option('useAutomationExtension', False)
-            
-            # User agent realista
-            chrome_opts.add_argument(
-                "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            )
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        if self.in_flight >= int(self.limit):
+            return 0.05
+        if self.rate > 0:
+            if self.tokens < 1:
+                return (1 - self.tokens) / self.rate
+            self.tokens -= 1
+        
+        self.in_flight += 1
+        return 0.0
+    
+    def acquire(self) -> None:
+        """Aguarda até que uma requisição possa ser enviada."""
+        with self._cond:
+            while True:
+                wait = self._try_acquire()
+                if not wait:
+                    return
+                self._cond.wait(timeout=wait)
+    
+    async def acquire_async(self) -> None:
+        """Versão para asyncio de acquire, sem bloquear o event loop."""
+        while True:
+            with self._cond:
+                wait = self._try_acquire()
+            if not wait:
+                return
+            await asyncio.sleep(min(wait, 0.5))
+    
+    def release(
+        self,
+        latency: float,
+        status_code: Optional[int],
+        retry_after: Optional[str] = None
+    ) -> None:
+        """Libera a vaga e ajusta o limite de concorrência conforme o resultado."""
+        with self._cond:
+            self.in_flight -= 1
             
-            # Instala e configura o ChromeDriver automaticamente
-            chromedriver_autoinstaller.install()
+            overloaded = status_code is None or status_code == 429 or status_code >= 500
+            if not overloaded:
+                # Média rápida da latência e referência lenta (que acompanha melhorias rapidamente)
+                if self.latency_avg is None:
+                    self.latency_avg = self.latency_baseline = latency
+                else:
+                    self.latency_avg = 0.7 * self.latency_avg + 0.3 * latency
+                    self.latency_baseline = min(
+                        self.latency_avg, 0.95 * self.latency_baseline + 0.05 * latency
+                    )
+                self.samples += 1
+                # Variações pequenas (< 100 ms) não indicam sobrecarga do servidor
+                latency_ceiling = max(
+                    self.latency_baseline * Config.RATE_LIMIT_LATENCY_FACTOR,
+                    self.latency_baseline + 0.1
+                )
+                overloaded = self.samples >= 5 and self.latency_avg > latency_ceiling
             
-            driver = webdriver.Chrome(options=chrome_opts)
+            if overloaded:
+                self._decrease(status_code, retry_after)
+            elif self.limit < self.max_concurrency:
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
             
+            self._cond.notify_all()
+    
+    def _decrease(self, status_code: Optional[int], retry_after: Optional[str]) -> None:
+        """Reduz o limite à metade, no máximo uma vez por intervalo de latência."""
+        now = time.monotonic()
+        
+        if status_code == 429:
             try:
-                # Abre a página de login
-                driver.get(login_url)
-                self.logger.info(f"✅ Página de login carregada: {login_url}")
-                
-                # Instruções para o usuário
-                print("\n" + "="*80)
-                print("🔐 AUTENTICAÇÃO INTERATIVA NECESSÁRIA")
-                print("="*80)
-                print(f"📌 Tribunal: {self.tribunal_name}")
-                print(f"🌐 URL: {login_url}")
-                print("\n📋 INSTRUÇÕES:")
-                print("  1. Uma janela do Chrome foi aberta")
-                print("  2. Faça login MANUALMENTE no sistema do tribunal")
-                print("  3. Complete o segundo fator de autenticação (2FA) se solicitado")
-                print("  4. Aguarde até estar completamente logado")
-                print("  5. O sistema detectará automaticamente quando o login for concluído")
-                print(f"\n⏱️  Tempo máximo: {timeout} segundos")
-                print("="*80 + "\n")
-                
-                # Aguarda o usuário completar o login
-                # Detecta quando sai da página de login/openid
-                start_time = time.time()
-                logged_in = False
-                
-                while time.time() - start_time < timeout:
-                    current_url = driver.current_url.lower()
-                    
-                    # Verifica se saiu das páginas de login
-                    if 'login' not in current_url and 'openid' not in current_url and 'auth' not in current_url:
-                        # Verifica se tem cookies de sessão
-                        cookies = driver.get_cookies()
-                        if cookies and len(cookies) > 0:
-                            self.logger.info("✅ Login detectado com sucesso!")
-                            logged_in = True
-                            break
-                    
-                    time.sleep(2)  # Verifica a cada 2 segundos
-                
-                if not logged_in:
-                    raise TimeoutException(f"Tempo esgotado aguardando login ({timeout}s)")
-                
-                # Captura todos os cookies
-                cookies = driver.get_cookies()
-                self.logger.info(f"🍪 Capturados {len(cookies)} cookies")
+                pause = float(retry_after) if retry_after else 1.0
+            except ValueError:
+                pause = 1.0
+            self._blocked_until = max(self._blocked_until, now + pause)
+        
+        if self.limit <= 1 or now - self._last_decrease < (self.latency_avg or 1.0):
+            return
+        
+        self._last_decrease = now
+        self.decreases += 1
+        self.limit = max(1.0, self.limit / 2)
+        self.logger.info(
+            f"🐢 {self.tribunal_name}: reduzindo concorrência para {int(self.limit)} "
+            f"(status {status_code if status_code is not None else 'falha de rede'})"
+        )
+    
+    def cancel(self) -> None:
+        """Libera a vaga (e o token) de uma requisição que não chegou a ser enviada."""
+        with self._cond:
+            self.in_flight -= 1
+            if self.rate > 0:
+                self.tokens = min(self.burst, self.tokens + 1)
+            self._cond.notify_all()
+    
+    def _finish(self, outcome: Dict, started: float) -> None:
+        """Encerra a requisição envolvida por request/request_async."""
+        if outcome.get('cancelled'):
+            self.cancel()
+            return
+        self.release(
+            outcome.get('latency', time.monotonic() - started),
+            outcome['status'],
+            outcome.get('retry_after')
+        )
+    
+    @contextmanager
+    def request(self) -> Iterator[Dict]:
+        """
+        Envolve uma requisição síncrona.
+        
+        O chamador registra no dicionário recebido o 'status' e, opcionalmente,
+        a 'latency' (tempo até os headers) e o header 'retry_after'. Com
+        'cancelled' (requisição desistida antes do envio), a vaga é apenas
+        liberada, sem ajustar o limite de concorrência.
+        """
+        self.acquire()
+        outcome: Dict = {'status': None}
+        started = time.monotonic()
+        try:
+            yield outcome
+        finally:
+            self._finish(outcome, started)
+    
+    @asynccontextmanager
+    async def request_async(self):
+        """Versão para asyncio de request."""
+        await self.acquire_async()
+        outcome: Dict = {'status': None}
+        started = time.monotonic()
+        try:
+            yield outcome
+        finally:
+            self._finish(outcome, started)
+    
+    @property
+    def state(self) -> Dict:
+        """Estado atual do limitador, para logs."""
+        with self._cond:
+            return {
+                'tribunal': self.tribunal_name,
+                'limite_concorrencia': int(self.limit),
+                'em_andamento': self.in_flight,
+                'tokens': round(self.tokens, 2),
+                'latencia_media_ms': round((self.latency_avg or 0) * 1000),
+                'latencia_referencia_ms': round((self.latency_baseline or 0) * 1000),
+                'reducoes': self.decreases
+            }
+    
+    def describe(self) -> str:
+        """Resumo legível do estado atual."""
+        state = self.state
+        return (
+            f"{state['tribunal']}: concorrência {state['limite_concorrencia']}/{self.max_concurrency}, "
+            f"{state['em_andamento']} em andamento, latência média {state['latencia_media_ms']} ms "
+            f"(referência {state['latencia_referencia_ms']} ms), {state['reducoes']} reduções"
+        )
+
+
+class CircuitOpenError(Exception):
+    """Requisição recusada porque o disjuntor do tribunal está aberto."""
+
+
+class SessionExpiredError(Exception):
+    """Requisição recusada pela API (401/403) porque a sessão do tribunal não é mais aceita."""
+    
+    def __init__(self, tribunal_name: str, status: int, generation: int) -> None:
+        """Guarda a geração da sessão recusada, usada por CourtSession.reauthenticate."""
+        super().__init__(f"Sessão do {tribunal_name} recusada pela API (status {status})")
+        self.generation = generation
+
+
+class CircuitBreaker:
+    """
+    Disjuntor de um tribunal.
+    
+    Após CIRCUIT_BREAKER_FAILURES falhas consecutivas (erros de rede, timeouts
+    ou respostas 5xx), o circuito abre e permanece aberto até o fim da
+    execução: as requisições seguintes ao tribunal falham imediatamente, sem
+    novas tentativas, e os demais tribunais seguem normalmente.
+    """
+    
+    def __init__(
+        self,
+        tribunal_name: str,
+        failure_threshold: Optional[int] = None,
+        logger: Optional[HearingLogger] = None
+    ) -> None:
+        """Inicializa o disjuntor fechado."""
+        self.tribunal_name = tribunal_name
+        self.failure_threshold = max(1, failure_threshold or Config.CIRCUIT_BREAKER_FAILURES)
+        self.logger = logger or HearingLogger()
+        self.consecutive_failures = 0
+        self.total_failures = 0
+        self.rejected = 0
+        self.last_error: Optional[str] = None
+        self._open = False
+        self._lock = threading.Lock()
+    
+    @property
+    def is_open(self) -> bool:
+        """Indica se as requisições ao tribunal estão suspensas."""
+        return self._open
+    
+    def check(self) -> None:
+        """
+        Verifica se uma requisição pode ser enviada.
+        
+        Raises:
+            CircuitOpenError: Se o circuito estiver aberto
+        """
+        if self._open:
+            with self._lock:
+                self.rejected += 1
+            raise CircuitOpenError(
+                f"{self.tribunal_name} indisponível nesta execução "
+                f"({self.total_failures} falhas; última: {self.last_error})"
+            )
+    
+    def record_success(self) -> None:
+        """Registra uma resposta bem-sucedida, zerando as falhas consecutivas."""
+        with self._lock:
+            self.consecutive_failures = 0
+    
+    def record_failure(self, error: Exception) -> None:
+        """Registra uma falha e abre o circuito ao atingir o limite."""
+        with self._lock:
+            self.consecutive_failures += 1
+            self.total_failures += 1
+            self.last_error = str(error)
+            if self._open or self.consecutive_failures < self.failure_threshold:
+                return
+            self._open = True
+        
+        self.logger.warning(
+            f"🔌 {self.tribunal_name}: circuito aberto após {self.consecutive_failures} "
+            f"falhas consecutivas; as demais consultas a este tribunal serão ignoradas"
+        )
+    
+    def describe(self) -> str:
+        """Resumo legível do estado atual."""
+        return (
+            f"{self.tribunal_name}: circuito {'aberto' if self._open else 'fechado'}, "
+            f"{self.total_failures} falhas, {self.rejected} requisições recusadas"
+        )
+
+
+class HearingStreamParser:
+    """
+    Parser incremental do JSON retornado pela API de pauta.
+    
+    Percorre o array 'resultado' um registro por vez e mantém apenas os campos
+    de HearingDataProcessor.COLUMN_MAP, de modo que a árvore completa de
+    objetos da resposta nunca fica inteira na memória. O resultado é uma
+    página com os mesmos metadados da API e 'resultado' como lista de tuplas.
+    """
+    
+    # Marca as páginas cujo 'resultado' já contém linhas compactas
+    COMPACT_ROWS_KEY = '_linhas_compactas'
+    
+    _RESULT_KEY_PATTERN = re.compile(r'"resultado"\s*:\s*\[')
+    _WHITESPACE = ' \t\r\n,'
+    
+    def __init__(self) -> None:
+        """Inicializa o parser vazio."""
+        self._project = self.compile_projection(HearingDataProcessor.COLUMN_MAP)
+        self.rows: List[Tuple] = []
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._prefix = ''
+        self._state = 'seek'  # seek → array → done
+    
+    def feed(self, chunk: str) -> None:
+        """Acrescenta um trecho da resposta e extrai os registros já completos."""
+        self._buffer += chunk
+        
+        if self._state == 'seek':
+            match = self._RESULT_KEY_PATTERN.search(self._buffer)
+            if not match:
+                return
+            self._prefix = self._buffer[:match.start()]
+            self._buffer = self._buffer[match.end():]
+            self._state = 'array'
+        
+        if self._state == 'array':
+            buffer = self._buffer
+            pos = 0
+            while True:
+                while pos < len(buffer) and buffer[pos] in self._WHITESPACE:
+                    pos += 1
+                if pos >= len(buffer):
+                    break
+                if buffer[pos] == ']':
+                    pos += 1
+                    self._state = 'done'
+                    break
+                try:
+                    record, pos_end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    break  # Registro incompleto: aguarda o próximo trecho
+                self.rows.append(self._project(record))
+                pos = pos_end
+            # Descarta o texto já consumido
+            self._buffer = buffer[pos:]
+    
+    def close(self) -> Dict:
+        """Finaliza a leitura e retorna a página com as linhas compactas."""
+        if self._state == 'seek':
+            # Sem array 'resultado' (ex.: resultado nulo): resposta pequena, lida de uma vez
+            data = json.loads(self._buffer)
+            records = data.get('resultado') or [] if isinstance(data, dict) else []
+            self.rows = [self._project(record) for record in records]
+        elif self._state == 'done':
+            # Recompõe os metadados com o texto que envolve o array 'resultado'
+            data = json.loads(f'{self._prefix}"resultado":[]{self._buffer}')
+        else:
+            raise ValueError("Resposta JSON da pauta incompleta")
+        
+        if not isinstance(data, dict):
+            return {}
+        data['resultado'] = self.rows
+        data[self.COMPACT_ROWS_KEY] = True
+        return data
+    
+    def parse_text(self, text: str) -> Dict:
+        """Lê uma resposta completa já em memória."""
+        self.feed(text)
+        return self.close()
+    
+    @staticmethod
+    def _compile_path(path: str) -> Callable[[Dict], object]:
+        """
+        Cria a função que lê um caminho de campos ('processo.numero') de um registro.
+        
+        Caminhos ausentes ou interrompidos por valores que não são objetos
+        resultam em None, tratados pela própria exceção da indexação.
+        """
+        parts = tuple(path.split('.'))
+        
+        if len(parts) == 1:
+            (first,) = parts
+            def get(record):
+                try:
+                    return record[first]
+                except (KeyError, TypeError):
+                    return None
+        elif len(parts) == 2:
+            first, second = parts
+            def get(record):
+                try:
+                    return record[first][second]
+                except (KeyError, TypeError):
+                    return None
+        elif len(parts) == 3:
+            first, second, third = parts
+            def get(record):
+                try:
+                    return record[first][second][third]
+                except (KeyError, TypeError):
+                    return None
+        else:
+            def get(record):
+                try:
+                    for part in parts:
+                        record = record[part]
+                    return record
+                except (KeyError, TypeError):
+                    return None
+        return get
+    
+    @classmethod
+    def compile_projection(cls, paths: Iterable[str]) -> Callable[[Dict], Tuple]:
+        """Cria a função que extrai de um registro apenas os campos informados, na ordem dada."""
+        getters = [cls._compile_path(path) for path in paths]
+        
+        def project(record: Dict) -> Tuple:
+            return tuple([get(record) for get in getters])
+        return project
+
+
+class ResponseBodyReader:
+    """
+    Consome em trechos de texto o corpo de uma resposta da API de pauta.
+    
+    Com STREAMING_JSON, cada trecho segue para o HearingStreamParser e,
+    com o cache de respostas habilitado, para o arquivo comprimido da
+    entrada, de modo que o corpo nunca fica inteiro na memória. Sem
+    STREAMING_JSON, os trechos são juntados e lidos com json.loads no final.
+    """
+    
+    def __init__(self, writer: Optional[ResponseCacheWriter] = None) -> None:
+        """Inicializa a leitura, opcionalmente gravando o corpo no cache."""
+        self.writer = writer
+        self._parser = HearingStreamParser() if Config.STREAMING_JSON else None
+        self._chunks: List[str] = []
+    
+    def feed(self, chunk: str) -> None:
+        """Acrescenta um trecho do corpo."""
+        if not chunk:
+            return
+        if self._parser:
+            self._parser.feed(chunk)
+        else:
+            self._chunks.append(chunk)
+        if self.writer:
+            self.writer.write(chunk)
+    
+    def close(self) -> Tuple[Dict, Optional[Dict]]:
+        """
+        Finaliza a leitura; o corpo só é publicado no cache se for um JSON válido.
+        
+        Returns:
+            Tupla (dados da página, metadados gravados no cache ou None)
+        """
+        try:
+            data = self._parser.close() if self._parser else json.loads(''.join(self._chunks))
+        except Exception:
+            self.discard()
+            raise
+        return data, self.writer.commit() if self.writer else None
+    
+    def discard(self) -> None:
+        """Abandona a gravação no cache de uma leitura interrompida."""
+        if self.writer:
+            self.writer.discard()
+
+
+class ChromeDriverCache:
+    """
+    Cache local do ChromeDriver, versionado pela versão principal do Chrome.
+    
+    A versão do Chrome instalado é lida localmente a cada login; o driver
+    correspondente só é baixado quando essa versão principal ainda não está
+    no cache (ou seja, quando o Chrome foi atualizado). Nas demais execuções
+    o binário em cache é usado sem nenhum acesso à rede. CHROMEDRIVER_PATH
+    fixa um driver específico e dispensa qualquer verificação.
+    """
+    
+    MANIFEST_FILE: str = 'manifest.json'
+    
+    def __init__(self, cache_dir: str = None, logger: Optional[HearingLogger] = None) -> None:
+        """Inicializa o cache no diretório informado."""
+        self.cache_dir = Path(cache_dir or Config.CHROMEDRIVER_CACHE_DIR)
+        self.logger = logger or HearingLogger()
+    
+    def _load_manifest(self) -> Dict:
+        """Carrega o registro dos drivers em cache (versão principal → driver)."""
+        manifest_path = self.cache_dir / self.MANIFEST_FILE
+        if not manifest_path.exists():
+            return {}
+        
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Erro ao ler cache do ChromeDriver: {e}")
+            return {}
+    
+    def _save_manifest(self, manifest: Dict) -> None:
+        """Grava o registro dos drivers em cache."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_dir / self.MANIFEST_FILE, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+    
+    def resolve(self) -> str:
+        """
+        Retorna o caminho do ChromeDriver compatível com o Chrome instalado.
+        
+        Raises:
+            RuntimeError: Se a versão do Chrome não puder ser detectada e não
+                houver driver em cache
+        """
+        if Config.CHROMEDRIVER_PATH:
+            return Config.CHROMEDRIVER_PATH
+        
+        chrome_version = chromedriver_autoinstaller.get_chrome_version()
+        major = chrome_version.split('.')[0] if chrome_version else None
+        manifest = self._load_manifest()
+        
+        if major is None and manifest:
+            # Versão do Chrome não detectada: usa o driver resolvido mais recentemente
+            major = max(manifest, key=lambda key: manifest[key]['resolved_at'])
+            self.logger.warning(f"⚠️ Versão do Chrome não detectada; usando ChromeDriver {major}")
+        if major is None:
+            raise RuntimeError("Não foi possível detectar a versão do Chrome instalado")
+        
+        entry = manifest.get(major)
+        if entry and Path(entry['path']).exists():
+            self.logger.debug(f"🧩 ChromeDriver {major} em cache: {entry['path']}")
+            return entry['path']
+        
+        self.logger.info(f"⬇️ Baixando ChromeDriver para o Chrome {chrome_version}...")
+        # O chromedriver_autoinstaller recusa (ValueError) um diretório inexistente
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        driver_path = chromedriver_autoinstaller.install(path=str(self.cache_dir))
+        if not driver_path:
+            raise RuntimeError(f"Não foi possível obter o ChromeDriver para o Chrome {chrome_version}")
+        
+        manifest[major] = {
+            'path': str(Path(driver_path).resolve()),
+            'chrome_version': chrome_version,
+            'resolved_at': datetime.now().isoformat()
+        }
+        self._save_manifest(manifest)
+        self.logger.info(f"💾 ChromeDriver {major} salvo em cache")
+        return manifest[major]['path']
+
+
+class LoginWatcher:
+    """
+    Condição de espera (WebDriverWait) que detecta a conclusão do login.
+    
+    Lê os eventos de rede do Chrome (log de performance do CDP) e considera o
+    login concluído quando uma página do tribunal fora das telas de
+    login/OpenID é recebida definindo cookies, sem esperar intervalos fixos.
+    Na falta desses eventos, recorre à URL atual e aos cookies do navegador.
+    """
+    
+    LOGIN_MARKERS: Tuple[str, ...] = ('login', 'openid', 'auth')
+    
+    def __init__(self, domain: str) -> None:
+        """Inicializa o observador para o domínio do tribunal."""
+        self.domain = domain.lower()
+        self._document_urls: Dict[str, str] = {}
+        self._cookie_requests: Set[str] = set()
+    
+    def _is_after_login(self, url: str) -> bool:
+        """Indica se a URL é uma página do tribunal fora das telas de login."""
+        url = url.lower()
+        return self.domain in url and not any(marker in url for marker in self.LOGIN_MARKERS)
+    
+    def _read_events(self, driver: webdriver.Chrome) -> None:
+        """Consome os eventos de rede acumulados desde a última leitura."""
+        for entry in driver.get_log('performance'):
+            message = json.loads(entry['message']).get('message', {})
+            method = message.get('method')
+            params = message.get('params', {})
+            
+            if method == 'Network.responseReceived' and params.get('type') == 'Document':
+                self._document_urls[params['requestId']] = params['response']['url']
+            elif method == 'Network.responseReceivedExtraInfo' and any(
+                header.lower() == 'set-cookie' for header in params.get('headers', {})
+            ):
+                self._cookie_requests.add(params['requestId'])
+    
+    def __call__(self, driver: webdriver.Chrome) -> bool:
+        """Retorna True quando o login estiver concluído."""
+        try:
+            self._read_events(driver)
+        except WebDriverException:
+            pass  # Log de performance indisponível; usa apenas a URL atual
+        
+        if any(
+            self._is_after_login(self._document_urls.get(request_id, ''))
+            for request_id in self._cookie_requests
+        ):
+            return True
+        return self._is_after_login(driver.current_url) and bool(driver.get_cookies())
+
+
+class CourtSession:
+    """Gerenciador de sessão para acesso aos tribunais com suporte a 2FA."""
+    
+    # Procura um refresh token OpenID no armazenamento do navegador
+    _FIND_REFRESH_TOKEN_JS: str = """
+        for (const storage of [window.localStorage, window.sessionStorage]) {
+            for (let i = 0; i < storage.length; i++) {
+                const key = storage.key(i);
+                const value = storage.getItem(key);
+                try {
+                    const parsed = JSON.parse(value);
+                    if (parsed && parsed.refresh_token) { return parsed.refresh_token; }
+                } catch (e) {}
+                if (key.toLowerCase().includes('refresh')) { return value; }
+            }
+        }
+        return null;
+    """
+    
+    def __init__(
+        self,
+        tribunal_name: str,
+        logger: Optional[HearingLogger] = None,
+        notifier: Optional[EmailNotifier] = None,
+        base_url: Optional[str] = None
+    ) -> None:
+        """Inicializa o gerenciador de sessão com headers padrão."""
+        self.tribunal_name = tribunal_name
+        self.base_url = base_url or f"https://pje.{tribunal_name.lower()}.jus.br/primeirograu/"
+        self.session = requests.Session()
+        self.logger = logger or HearingLogger()
+        self.notifier = notifier or EmailNotifier()
+        self.token_cache = TokenCache(logger=self.logger)
+        self.response_cache = (
+            ResponseCache(logger=self.logger) if Config.RESPONSE_CACHE_ENABLED else None
+        )
+        # Como a sessão foi obtida na última autenticação e quanto tempo levou
+        self.login_metrics: Dict = {}
+        # Renovação da sessão após 401/403, uma única vez para todas as threads
+        self.auth_generation = 0
+        self._auth_lock = threading.Lock()
+        self._reauth_failed = False
+        self._last_authenticated = 0.0
+        # Limita a taxa e a concorrência das requisições à API deste tribunal
+        self.rate_limiter = AdaptiveRateLimiter(tribunal_name, logger=self.logger)
+        # Suspende as consultas ao tribunal após falhas consecutivas
+        self.circuit_breaker = CircuitBreaker(tribunal_name, logger=self.logger)
+        # Orçamento de tempo da execução em andamento (definido pelo HearingManager)
+        self.budget: Optional[RunBudget] = None
+        # Períodos (dataInicio, dataFim) servidos de cache vencido com o circuito aberto
+        self._stale_served: List[Tuple[str, str]] = []
+        self._stale_lock = threading.Lock()
+        # Consultas idênticas em andamento, compartilhadas entre as threads
+        self._in_flight: Dict[Tuple, Future] = {}
+        self._in_flight_lock = threading.Lock()
+        self._set_headers()
+        
+    def _set_headers(self) -> None:
+        """Define headers padrão para a sessão."""
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+            'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1'
+        }
+        self.session.headers.update(headers)
+    
+    def restore_cached_session(self) -> bool:
+        """
+        Aplica os tokens em cache à sessão e verifica se ainda funcionam.
+        
+        Returns:
+            bool: True se a sessão em cache é válida
+        """
+        started = time.monotonic()
+        cached_cookies = self.token_cache.load_tokens(self.tribunal_name)
+        if not cached_cookies:
+            return False
+        
+        self.logger.info(f"🔑 Usando tokens em cache para {self.tribunal_name}")
+        self.apply_cookies(cached_cookies)
+        access_token = self.token_cache.load_access_token(self.tribunal_name)
+        if access_token:
+            self.session.headers['Authorization'] = f'Bearer {access_token}'
+        else:
+            self.session.headers.pop('Authorization', None)
+        
+        # Validada há pouco: dispensa a verificação; a primeira consulta à API
+        # confirma a sessão e, se recusada (401/403), a renova (reauthenticate)
+        if self.token_cache.validated_within(
+            self.tribunal_name, timedelta(minutes=Config.SESSION_VALIDATION_TTL_MINUTES)
+        ):
+            self.logger.debug(f"✅ Sessão do {self.tribunal_name} validada recentemente")
+            self.record_login('cache', started)
+            return True
+        
+        # Valida se os tokens ainda funcionam
+        status = self._session_status()
+        if status:
+            self.token_cache.touch_tokens(self.tribunal_name, self.session_cookies())
+            self.record_login('cache', started)
+            return True
+        
+        if status is None:
+            # Falha de rede ou resposta inesperada: não indica que a sessão expirou
+            self.logger.warning("⚠️ Não foi possível verificar os tokens em cache, realizando novo login")
+            return False
+        
+        self.logger.warning("⚠️ Tokens em cache inválidos, realizando novo login")
+        self.token_cache.record_expiry(self.tribunal_name)
+        self.token_cache.clear_tokens(self.tribunal_name)
+        return False
+    
+    def mark_authenticated(self) -> None:
+        """
+        Registra uma resposta autenticada da API, que vale como validação da sessão.
+        
+        A gravação no TokenCache ocorre no máximo uma vez por minuto.
+        """
+        now = time.monotonic()
+        if now - self._last_authenticated < 60:
+            return
+        self._last_authenticated = now
+        self.token_cache.touch_tokens(self.tribunal_name, self.session_cookies())
+    
+    def reauthenticate(self, failed_generation: int) -> bool:
+        """
+        Renova a sessão recusada pela API (401/403) e permite repetir a requisição.
+        
+        Só a primeira thread a perceber a recusa renova a sessão (pelo SSO,
+        sem navegador, ou com novo login); as demais apenas aguardam e
+        reaproveitam a sessão nova. Se a renovação falhar, não é tentada de
+        novo nesta execução.
+        
+        Args:
+            failed_generation: auth_generation em uso pela requisição recusada
+            
+        Returns:
+            bool: True se há uma sessão nova para repetir a requisição
+        """
+        with self._auth_lock:
+            if self.auth_generation != failed_generation:
+                return True
+            if self._reauth_failed:
+                return False
+            
+            self.logger.warning(f"🔐 Sessão do {self.tribunal_name} recusada pela API; renovando...")
+            self.token_cache.record_expiry(self.tribunal_name)
+            self.token_cache.clear_tokens(self.tribunal_name)
+            
+            if self.login_interactive(f'{self.base_url}login.seam'):
+                self.auth_generation += 1
+                return True
+            
+            self._reauth_failed = True
+            return False
+    
+    def record_login(self, method: str, started: float) -> None:
+        """Registra como a sessão foi obtida e quanto tempo levou (métrica de login)."""
+        self.login_metrics = {'metodo': method, 'segundos': round(time.monotonic() - started, 2)}
+        self.logger.info(
+            f"⏱️ Login no {self.tribunal_name}: {self.login_metrics['segundos']:.2f}s ({method})"
+        )
+    
+    def apply_cookies(self, cookies: List[Dict]) -> None:
+        """Adiciona cookies capturados do navegador (ou do cache) à sessão requests."""
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain', '')
+            )
+    
+    def session_cookies(self) -> List[Dict]:
+        """Cookies atuais da sessão requests, no formato salvo no TokenCache."""
+        return [
+            {'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain, 'path': cookie.path}
+            for cookie in self.session.cookies
+            if Config.SSO_HOST not in cookie.domain
+        ]
+    
+    # Recursos dispensáveis no login, bloqueados via CDP
+    BLOCKED_LOGIN_RESOURCES: List[str] = [
+        '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.ico',
+        '*.woff', '*.woff2', '*.ttf', '*.otf',
+        '*google-analytics.com*', '*googletagmanager.com*', '*hotjar.com*', '*clarity.ms*'
+    ]
+    
+    @staticmethod
+    def create_login_driver(
+        logger: Optional[HearingLogger] = None,
+        profile_name: Optional[str] = None
+    ) -> webdriver.Chrome:
+        """
+        Abre o Chrome de forma visível para o login manual com 2FA.
+        
+        O carregamento é 'eager' (não espera imagens e scripts tardios), imagens,
+        fontes e analytics são bloqueados via CDP e o perfil em CHROME_PROFILE_DIR
+        é reaproveitado entre execuções, mantendo a sessão do SSO e o cache do
+        navegador. Navegadores abertos ao mesmo tempo precisam de perfis
+        distintos (profile_name), pois o Chrome bloqueia o diretório em uso.
+        O log de performance alimenta o LoginWatcher.
+        """
+        # Configuração do Chrome - MODO VISÍVEL para interação manual
+        chrome_opts = ChromeOptions()
+        chrome_opts.page_load_strategy = 'eager'
+        chrome_opts.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        if Config.CHROME_PROFILE_DIR:
+            profile_dir = Path(Config.CHROME_PROFILE_DIR).resolve()
+            if profile_name:
+                profile_dir = profile_dir / profile_name
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            chrome_opts.add_argument(f"--user-data-dir={profile_dir}")
+        chrome_opts.add_argument("--no-first-run")
+        chrome_opts.add_argument("--no-default-browser-check")
+        chrome_opts.add_argument("--start-maximized")
+        chrome_opts.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_opts.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_opts.add_experimental_option('useAutomationExtension', False)
+        
+        # User agent realista
+        chrome_opts.add_argument(
+            "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/120.0.0.0 Safari/537.36"
+        )
+        
+        # ChromeDriver compatível, do cache local (baixado só quando o Chrome muda de versão)
+        service = ChromeService(executable_path=ChromeDriverCache(logger=logger).resolve())
+        
+        driver = webdriver.Chrome(service=service, options=chrome_opts)
+        if Config.LOGIN_BLOCK_RESOURCES:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd(
+                'Network.setBlockedURLs', {'urls': CourtSession.BLOCKED_LOGIN_RESOURCES}
+            )
+        return driver
+    
+    @staticmethod
+    def print_login_instructions(tribunal_name: str, login_url: str, timeout: int) -> None:
+        """Exibe no console as instruções do login manual."""
+        print("\n" + "="*80)
+        print("🔐 AUTENTICAÇÃO INTERATIVA NECESSÁRIA")
+        print("="*80)
+        print(f"📌 Tribunal: {tribunal_name}")
+        print(f"🌐 URL: {login_url}")
+        print("\n📋 INSTRUÇÕES:")
+        print("  1. Uma janela do Chrome foi aberta")
+        print("  2. Faça login MANUALMENTE no sistema do tribunal")
+        print("  3. Complete o segundo fator de autenticação (2FA) se solicitado")
+        print("  4. Aguarde até estar completamente logado")
+        print("  5. O sistema detectará automaticamente quando o login for concluído")
+        print(f"\n⏱️  Tempo máximo: {timeout} segundos")
+        print("="*80 + "\n")
+    
+    @staticmethod
+    def wait_for_login(
+        driver: webdriver.Chrome,
+        timeout: int,
+        domain: Optional[str] = None,
+        poll_interval: float = 0.25
+    ) -> bool:
+        """
+        Aguarda o login ser concluído no domínio do tribunal (ver LoginWatcher).
+        
+        Args:
+            driver: Navegador na página de login do tribunal
+            timeout: Tempo máximo em segundos
+            domain: Domínio do tribunal (padrão: o da página atual)
+            poll_interval: Intervalo entre as leituras dos eventos do navegador
+            
+        Returns:
+            bool: True se o login foi concluído dentro do tempo limite
+        """
+        watcher = LoginWatcher(domain or driver.current_url.split('/')[2])
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=poll_interval).until(watcher)
+            return True
+        except TimeoutException:
+            return False
+    
+    def capture_login(self, driver: webdriver.Chrome) -> None:
+        """Copia os cookies do navegador já autenticado para a sessão e o cache."""
+        cookies = driver.get_cookies()
+        self.logger.info(f"🍪 Capturados {len(cookies)} cookies de {self.tribunal_name}")
+        
+        # Adiciona cookies à sessão requests
+        self.apply_cookies(cookies)
+        
+        # Salva tokens no cache para uso futuro
+        self.token_cache.save_tokens(self.tribunal_name, cookies)
+        self._capture_sso_credentials(driver)
+    
+    def _capture_sso_credentials(self, driver: webdriver.Chrome) -> None:
+        """
+        Guarda os cookies do SSO do PDPJ e o refresh token OpenID do navegador.
+        
+        São eles que permitem renovar as sessões depois sem abrir o navegador.
+        """
+        if not Config.SSO_REFRESH_ENABLED:
+            return
+        
+        try:
+            # get_cookies só devolve os cookies do domínio atual; o CDP devolve todos
+            all_cookies = driver.execute_cdp_cmd('Network.getAllCookies', {}).get('cookies', [])
+            sso_cookies = [
+                {key: cookie[key] for key in ('name', 'value', 'domain', 'path') if key in cookie}
+                for cookie in all_cookies
+                if Config.SSO_HOST in cookie.get('domain', '')
+            ]
+            refresh_token = driver.execute_script(self._FIND_REFRESH_TOKEN_JS)
+        except WebDriverException as e:
+            self.logger.debug(f"Credenciais do SSO indisponíveis no navegador: {e}")
+            return
+        
+        if sso_cookies or refresh_token:
+            self.token_cache.save_sso_credentials(sso_cookies, refresh_token)
+    
+    @staticmethod
+    def _jwt_claims(token: str) -> Dict:
+        """Lê (sem validar a assinatura) as claims de um token JWT."""
+        try:
+            payload = token.split('.')[1]
+            return json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        except (IndexError, ValueError):
+            return {}
+    
+    def _login_completed(self, response: requests.Response) -> bool:
+        """Indica se uma navegação terminou autenticada no tribunal (fora do login/SSO)."""
+        final_url = response.url.lower()
+        return (
+            response.ok
+            and Config.SSO_HOST not in final_url
+            and 'login' not in final_url
+            and 'openid' not in final_url
+        )
+    
+    def _refresh_with_token(self, refresh_token: str) -> bool:
+        """Obtém um novo access token no SSO com o grant refresh_token do OpenID."""
+        claims = self._jwt_claims(refresh_token)
+        if claims.get('exp') and claims['exp'] <= time.time():
+            self.logger.debug("Refresh token do SSO expirado")
+            return False
+        
+        token_url = (
+            f"https://{Config.SSO_HOST}/auth/realms/{Config.SSO_REALM}"
+            "/protocol/openid-connect/token"
+        )
+        response = self.session.post(
+            token_url,
+            data={
+                'grant_type': 'refresh_token',
+                'refresh_token': refresh_token,
+                'client_id': claims.get('azp', '')
+            },
+            timeout=Config.REQUEST_TIMEOUT_SECONDS
+        )
+        if not response.ok:
+            self.logger.debug(f"Refresh token recusado pelo SSO (status {response.status_code})")
+            return False
+        
+        tokens = response.json()
+        access_token = tokens['access_token']
+        domain = self.base_url.split('/')[2]
+        bearer = None
+        previous_authorization = self.session.headers.get('Authorization')
+        if any(cookie.name == 'access_token' for cookie in self.session.cookies):
+            self.session.cookies.set('access_token', access_token, domain=domain)
+        else:
+            self.session.headers['Authorization'] = f'Bearer {access_token}'
+            bearer = access_token
+        
+        if not self._validate_session():
+            # Não deixa um token recusado substituir a autenticação que a sessão já tinha
+            if bearer and previous_authorization:
+                self.session.headers['Authorization'] = previous_authorization
+            elif bearer:
+                self.session.headers.pop('Authorization', None)
+            return False
+        # Grava a sessão renovada, como no caminho pelos cookies do SSO
+        self.token_cache.save_tokens(self.tribunal_name, self.session_cookies(), access_token=bearer)
+        self.token_cache.save_sso_credentials([], tokens.get('refresh_token'))
+        return True
+    
+    def _refresh_with_sso_cookies(self, sso_cookies: List[Dict]) -> bool:
+        """
+        Refaz o fluxo SSO do tribunal apenas com requisições HTTP.
+        
+        Com a sessão do SSO ainda ativa, o provedor redireciona de volta ao
+        tribunal sem pedir credenciais e o tribunal emite novos cookies de sessão.
+        """
+        self.apply_cookies(sso_cookies)
+        response = self.session.get(
+            f'{self.base_url}authenticateSSO.seam',
+            timeout=Config.REQUEST_TIMEOUT_SECONDS,
+            allow_redirects=True
+        )
+        if not self._login_completed(response) or not self._validate_session():
+            return False
+        
+        self.token_cache.save_tokens(self.tribunal_name, self.session_cookies())
+        # O SSO pode ter renovado os próprios cookies
+        self.token_cache.save_sso_credentials([
+            {'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain, 'path': cookie.path}
+            for cookie in self.session.cookies
+            if Config.SSO_HOST in cookie.domain
+        ])
+        return True
+    
+    def refresh_session(self) -> bool:
+        """
+        Renova a sessão sem navegador, com as credenciais do SSO do último login.
+        
+        Tenta primeiro o refresh token OpenID e depois o cookie de sessão do
+        SSO. O navegador só é necessário se ambos falharem (sessão do SSO
+        encerrada ou novo 2FA exigido).
+        
+        Returns:
+            bool: True se a sessão foi renovada
+        """
+        if not Config.SSO_REFRESH_ENABLED:
+            return False
+        credentials = self.token_cache.load_sso_credentials()
+        if not credentials:
+            return False
+        
+        self.logger.info(f"🔄 Renovando sessão do {self.tribunal_name} pelo SSO, sem navegador...")
+        started = time.monotonic()
+        try:
+            renewed = (
+                bool(credentials.get('refresh_token'))
+                and self._refresh_with_token(credentials['refresh_token'])
+            ) or (
+                bool(credentials.get('cookies'))
+                and self._refresh_with_sso_cookies(credentials['cookies'])
+            )
+        except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+            self.logger.debug(f"Erro ao renovar sessão pelo SSO: {e}")
+            renewed = False
+        
+        if renewed:
+            self.logger.info(f"✅ Sessão do {self.tribunal_name} renovada sem navegador")
+            self.record_login('renovação SSO', started)
+        else:
+            self.logger.info(f"🔐 Renovação sem navegador indisponível para {self.tribunal_name}")
+        return renewed
+    
+    def login_interactive(self, login_url: str, timeout: int = 300) -> bool:
+        """
+        Realiza login interativo no sistema do tribunal com suporte a 2FA.
+        
+        Abre o navegador Chrome de forma visível para que o usuário possa:
+        1. Inserir credenciais manualmente
+        2. Completar o segundo fator de autenticação (2FA)
+        3. Aguarda até que o login seja concluído
+        4. Captura e salva os cookies/tokens para uso posterior
+        
+        Para vários tribunais com um único login no SSO do PDPJ, use SsoLoginManager.
+        
+        Args:
+            login_url: URL da página de login do tribunal
+            timeout: Tempo máximo em segundos para aguardar o login (padrão: 300s = 5 minutos)
+            
+        Returns:
+            bool: True se o login foi bem-sucedido, False caso contrário
+        """
+        # Tenta carregar tokens do cache primeiro e depois renová-los sem navegador
+        if self.restore_cached_session() or self.refresh_session():
+            return True
+        
+        try:
+            self.logger.info(f"🌐 Iniciando login interativo para {self.tribunal_name}")
+            self.logger.info(f"🔗 URL: {login_url}")
+            
+            started = time.monotonic()
+            driver = self.create_login_driver(self.logger, profile_name=self.tribunal_name)
+            
+            try:
+                # Abre a página de login
+                driver.get(login_url)
+                self.logger.info(f"✅ Página de login carregada: {login_url}")
+                
+                # Aguarda o usuário completar o login
+                self.print_login_instructions(self.tribunal_name, login_url, timeout)
+                if not self.wait_for_login(driver, timeout, domain=login_url.split('/')[2]):
+                    raise TimeoutException(f"Tempo esgotado aguardando login ({timeout}s)")
+                self.logger.info("✅ Login detectado com sucesso!")
                 
-                # Adiciona cookies à sessão requests
-                for cookie in cookies:
-                    self.session.cookies.set(
-                        cookie['name'],
-                        cookie['value'],
-                        domain=cookie.get('domain', '')
+                self.capture_login(driver)
+                self.record_login('navegador', started)
+                
+                print("\n✅ Login concluído com sucesso!")
+                print("💾 Tokens salvos para uso futuro\n")
+                
+                return True
+                
+            finally:
+                # Fecha o navegador
+                driver.quit()
+                
+        except TimeoutException:
+            msg = f"⏱️ Tempo esgotado aguardando login em {self.tribunal_name}"
+            self.logger.error(msg, exc_info=False)
+            self.notifier.send(f"Timeout no login de {self.tribunal_name}. O usuário não completou o login a tempo.")
+            return False
+            
+        except WebDriverException as e:
+            msg = f"❌ Erro no WebDriver ao autenticar em {self.tribunal_name}: {e}"
+            self.logger.error(msg)
+            self.notifier.send(f"Erro no navegador ao tentar login em {self.tribunal_name}. Verifique se o Chrome está instalado.")
+            return False
+            
+        except Exception as e:
+            msg = f"❌ Erro inesperado ao autenticar em {self.tribunal_name}: {e}"
+            self.logger.error(msg)
+            self.notifier.send(f"Falha no login de {self.tribunal_name}. Erro: {e}")
+            return False
+    
+    def _session_status(self) -> Optional[bool]:
+        """
+        Verifica se a sessão atual ainda está ativa.
+        
+        Um redirecionamento para a tela de login ou para o SSO, ou uma resposta
+        401/403, indica sessão recusada; status 200 ou outros redirecionamentos
+        (ex.: para o painel) indicam sessão ativa.
+        
+        Returns:
+            Optional[bool]: True se ativa, False se recusada pelo tribunal e
+            None se não foi possível verificar (falha de rede ou outro status)
+        """
+        try:
+            response = self.session.get(self.base_url, timeout=10, allow_redirects=False)
+        except Exception as e:
+            self.logger.debug(f"⚠️ Erro ao validar sessão: {e}")
+            return None
+        
+        if response.status_code == 200:
+            valid = True
+        elif response.is_redirect:
+            location = response.headers.get('Location', '').lower()
+            valid = Config.SSO_HOST not in location and not any(
+                marker in location for marker in LoginWatcher.LOGIN_MARKERS
+            )
+        elif response.status_code in [401, 403]:
+            valid = False
+        else:
+            self.logger.debug(f"⚠️ Sessão não verificada (status {response.status_code})")
+            return None
+        
+        if valid:
+            self.logger.debug(f"✅ Sessão válida para {self.tribunal_name}")
+        else:
+            self.logger.debug(f"❌ Sessão inválida (status {response.status_code})")
+        return valid
+    
+    def _validate_session(self) -> bool:
+        """Valida se a sessão atual ainda está ativa (False também quando não foi possível verificar)."""
+        return self._session_status() is True
+    
+    @staticmethod
+    def _build_search_params(
+        search_start_date: str,
+        search_end_date: str,
+        situation_code: str,
+        page_number: str,
+        results_per_page: str,
+        order: str
+    ) -> Dict[str, str]:
+        """Monta os parâmetros da consulta à API de pauta."""
+        return {
+            'dataFim': search_end_date,
+            'dataInicio': search_start_date,
+            'codigoSituacao': situation_code,
+            'numeroPagina': page_number,
+            'tamanhoPagina': results_per_page,
+            'ordenacao': order
+        }
+    
+    def _check_response_cache(
+        self,
+        api_url: str,
+        params: Dict[str, str],
+        prefer_cache: bool,
+        allow_stale: bool = False
+    ) -> Tuple[Optional[str], Optional[Dict], Dict[str, str], Optional[Dict]]:
+        """
+        Consulta o cache de respostas antes de uma requisição.
+        
+        Com allow_stale (circuito do tribunal aberto), uma entrada fora do TTL
+        também é servida, mas o período fica registrado para que a janela seja
+        informada como desatualizada (ver take_stale_served).
+        
+        Returns:
+            Tupla (chave, entrada em cache, headers condicionais, dados prontos).
+            Os dados prontos só são preenchidos quando a entrada pode ser servida
+            sem consultar o tribunal.
+        """
+        if not self.response_cache:
+            return None, None, {}, None
+        
+        cache_key = ResponseCache.make_key(self.tribunal_name, api_url, params)
+        cached = self.response_cache.get(cache_key)
+        headers: Dict[str, str] = {}
+        if not cached:
+            return cache_key, None, headers, None
+        
+        if prefer_cache or self.response_cache.is_fresh(
+            cached, ResponseCache.ttl_for_window(params['dataInicio'])
+        ):
+            self.logger.debug(
+                f"📦 Cache: {params['dataInicio']} a {params['dataFim']} "
+                f"(página {params['numeroPagina']})"
+            )
+            data = self._load_cached(cache_key)
+            if data is not None:
+                return cache_key, cached, headers, data
+            return cache_key, None, headers, None
+        
+        if allow_stale:
+            self.logger.warning(
+                f"📦 Cache vencido servido com o circuito aberto: "
+                f"{params['dataInicio']} a {params['dataFim']} (de {cached['fetched_at'][:16]})"
+            )
+            data = self._load_cached(cache_key)
+            if data is not None:
+                with self._stale_lock:
+                    self._stale_served.append((params['dataInicio'], params['dataFim']))
+                return cache_key, cached, headers, data
+            return cache_key, None, headers, None
+        
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        return cache_key, cached, headers, None
+    
+    def check_budget(self, outcome: Dict, search_start_date: str, search_end_date: str) -> None:
+        """
+        Desiste de uma requisição se o orçamento de tempo da execução se esgotou.
+        
+        Chamada depois de obtida a vaga no AdaptiveRateLimiter, de modo que as
+        consultas que aguardavam na fila (páginas, sub-janelas e janelas
+        inteiras) são adiadas sem ir ao tribunal. Respostas servidas do cache
+        não passam por aqui.
+        
+        Raises:
+            RunBudgetExceeded: Se o orçamento já se esgotou
+        """
+        if self.budget and self.budget.expired:
+            outcome['cancelled'] = True
+            self.budget.check(
+                f"Consulta ao {self.tribunal_name} de {search_start_date} a {search_end_date}"
+            )
+    
+    def take_stale_served(self, start_date: date, end_date: date) -> bool:
+        """
+        Indica (e esquece) se alguma consulta do período foi servida de cache vencido.
+        
+        Como as janelas de um tribunal são disjuntas, as consultas de uma
+        janela e de suas sub-janelas caem todas dentro do seu período.
+        """
+        start, end = start_date.isoformat(), end_date.isoformat()
+        with self._stale_lock:
+            inside = [item for item in self._stale_served if start <= item[0] and item[1] <= end]
+            self._stale_served = [item for item in self._stale_served if item not in inside]
+        return bool(inside)
+    
+    def _load_cached(self, cache_key: str) -> Optional[Dict]:
+        """
+        Lê do disco, em trechos, o corpo de uma resposta em cache.
+        
+        Um corpo ilegível remove a entrada e retorna None, para que a
+        consulta seja refeita sem cabeçalhos condicionais.
+        """
+        reader = ResponseBodyReader()
+        try:
+            for chunk in self.response_cache.iter_body(cache_key):
+                reader.feed(chunk)
+            return reader.close()[0]
+        except ResponseCache.READ_ERRORS as e:
+            self.logger.warning(f"Cache de resposta ilegível, descartado: {e}")
+            self.response_cache.discard(cache_key)
+            return None
+    
+    def _body_reader(self, cache_key: Optional[str], headers) -> ResponseBodyReader:
+        """Cria o leitor do corpo de uma resposta, gravando-o no cache quando habilitado."""
+        if not self.response_cache:
+            return ResponseBodyReader()
+        return ResponseBodyReader(self.response_cache.writer(
+            cache_key, etag=headers.get('ETag'), last_modified=headers.get('Last-Modified')
+        ))
+    
+    def _read_response(
+        self,
+        response: requests.Response,
+        cache_key: Optional[str],
+        cached: Optional[Dict]
+    ) -> Dict:
+        """
+        Lê o corpo de uma resposta da API em trechos (ver ResponseBodyReader).
+        
+        O corpo vai ao mesmo tempo para o parser e para o cache de respostas,
+        sem nunca ser mantido inteiro na memória.
+        """
+        response.encoding = response.encoding or 'utf-8'
+        reader = self._body_reader(cache_key, response.headers)
+        try:
+            for chunk in response.iter_content(chunk_size=64 * 1024, decode_unicode=True):
+                reader.feed(chunk)
+        except BaseException:
+            reader.discard()
+            raise
+        data, entry = reader.close()
+        self._log_cache_match(cached, entry)
+        return data
+    
+    def _log_cache_match(self, cached: Optional[Dict], entry: Optional[Dict]) -> None:
+        """Registra quando a resposta gravada tem o mesmo conteúdo da entrada anterior."""
+        if cached and entry and cached.get('content_hash') == entry['content_hash']:
+            self.logger.debug("📦 Conteúdo idêntico ao do cache")
+    
+    def search_hearings(
+        self,
+        api_url: str,
+        search_start_date: str,
+        search_end_date: str,
+        situation_code: str = 'M',
+        page_number: str = '1',
+        results_per_page: str = '1500',
+        order: str = 'asc',
+        prefer_cache: bool = False
+    ) -> Dict:
+        """
+        Realiza busca de audiências na API do tribunal.
+        
+        Uma consulta idêntica a outra ainda em andamento não gera uma nova
+        requisição: aguarda e recebe o mesmo resultado (ou a mesma exceção).
+        """
+        request_key = (
+            api_url, search_start_date, search_end_date, situation_code,
+            str(page_number), str(results_per_page), order, prefer_cache
+        )
+        with self._in_flight_lock:
+            future = self._in_flight.get(request_key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[request_key] = Future()
+        
+        if not owner:
+            self.logger.debug(
+                f"🔗 Consulta idêntica em andamento: {search_start_date} a {search_end_date}"
+            )
+            return future.result()
+        
+        try:
+            data = self._search_with_reauth(
+                api_url, search_start_date, search_end_date, situation_code,
+                page_number, results_per_page, order, prefer_cache
+            )
+            future.set_result(data)
+            return data
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[request_key]
+
+    def _search_with_reauth(self, *args) -> Dict:
+        """
+        Executa a busca e, se a sessão for recusada (401/403), a renova e repete a busca uma vez.
+        
+        A renovação (que pode exigir novo login no navegador) fica fora das
+        novas tentativas de _search_hearings, e a busca repetida tem de novo
+        todo o prazo REQUEST_DEADLINE_SECONDS.
+        """
+        try:
+            return self._search_hearings(*args)
+        except SessionExpiredError as e:
+            if not self.reauthenticate(e.generation):
+                raise
+            self.logger.info(f"🔁 Repetindo consulta ao {self.tribunal_name} com a sessão renovada")
+            return self._search_hearings(*args)
+
+    @tenacity_retry(
+        stop=stop_after_attempt(3) | stop_after_delay(Config.REQUEST_DEADLINE_SECONDS),
+        wait=wait_exponential(multiplier=1, min=4, max=20),
+        retry=retry_if_exception_type(requests.exceptions.RequestException)
+    )
+    def _search_hearings(
+        self, 
+        api_url: str,
+        search_start_date: str,
+        search_end_date: str,
+        situation_code: str = 'M',
+        page_number: str = '1',
+        results_per_page: str = '1500',
+        order: str = 'asc',
+        prefer_cache: bool = False
+    ) -> Dict:
+        """
+        Realiza busca de audiências na API do tribunal com retry automático.
+        
+        Quando o cache de respostas está habilitado, respostas dentro do TTL da
+        janela são servidas do disco e as demais são revalidadas com
+        If-None-Match/If-Modified-Since quando o servidor fornece ETag/Last-Modified.
+        Com prefer_cache=True, qualquer resposta em cache é usada independentemente do TTL.
+        
+        As tentativas param após REQUEST_DEADLINE_SECONDS. Com o circuito do
+        tribunal aberto, respostas em cache ainda são servidas e as demais
+        buscas falham imediatamente com CircuitOpenError.
+        """
+        params = self._build_search_params(
+            search_start_date, search_end_date, situation_code,
+            page_number, results_per_page, order
+        )
+        cache_key, cached, headers, cached_data = self._check_response_cache(
+            api_url, params, prefer_cache, allow_stale=self.circuit_breaker.is_open
+        )
+        if cached_data is not None:
+            return cached_data
+        self.circuit_breaker.check()
+        generation = self.auth_generation
+        
+        try:
+            self.logger.debug(f"🔍 Buscando audiências: {search_start_date} a {search_end_date}")
+            with self.rate_limiter.request() as outcome:
+                self.check_budget(outcome, search_start_date, search_end_date)
+                started = time.monotonic()
+                response = self.session.get(
+                    api_url, params=params, headers=headers,
+                    timeout=Config.REQUEST_TIMEOUT_SECONDS, stream=True
+                )
+                outcome['latency'] = time.monotonic() - started
+                outcome['status'] = response.status_code
+                outcome['retry_after'] = response.headers.get('Retry-After')
+                with response:
+                    response.raise_for_status()
+                    self.circuit_breaker.record_success()
+                    self.mark_authenticated()
+                    
+                    if response.status_code == 304 and cached:
+                        self.logger.debug(
+                            f"📦 Resposta não modificada (304): {search_start_date} a {search_end_date}"
+                        )
+                        data = self._load_cached(cache_key)
+                        if data is None:
+                            # Entrada descartada: a próxima tentativa consulta sem cabeçalhos condicionais
+                            raise requests.exceptions.ContentDecodingError("Cache de resposta ilegível após 304")
+                        self.response_cache.touch(cache_key, cached)
+                        return data
+                    
+                    data = self._read_response(response, cache_key, cached)
+            
+            total = len(data.get('resultado', []))
+            self.logger.debug(f"✅ {total} audiências encontradas")
+            
+            return data
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code in [401, 403]:
+                self.logger.error(f"❌ Não autenticado (status {e.response.status_code})")
+                # Não é repetida aqui: _search_with_reauth renova a sessão e refaz a busca
+                raise SessionExpiredError(self.tribunal_name, e.response.status_code, generation) from e
+            if e.response.status_code >= 500:
+                self.circuit_breaker.record_failure(e)
+            self.logger.error(f"Erro HTTP na API {api_url}: {e}")
+            raise
+        except requests.exceptions.RequestException as e:
+            self.circuit_breaker.record_failure(e)
+            self.logger.error(f"Erro na requisição à API {api_url}: {e}")
+            raise
+
+    def iter_hearing_pages(
+        self,
+        api_url: str,
+        search_start_date: str,
+        search_end_date: str,
+        situation_code: str = 'M',
+        results_per_page: Optional[int] = None,
+        order: str = 'asc',
+        prefer_cache: bool = False,
+        total_count: Optional[int] = None
+    ) -> Iterator[Dict]:
+        """
+        Percorre todas as páginas de uma busca de audiências, uma página por vez.
+        
+        A página seguinte é solicitada em segundo plano enquanto a atual é
+        entregue ao chamador, de forma que o processamento de uma página
+        ocorre em paralelo ao download da próxima.
+        
+        Args:
+            api_url: URL da API de pauta do tribunal
+            search_start_date: Data inicial no formato YYYY-MM-DD
+            search_end_date: Data final no formato YYYY-MM-DD
+            situation_code: Código de situação da audiência (padrão: 'M')
+            results_per_page: Tamanho da página (padrão: Config.HEARINGS_PAGE_SIZE)
+            order: Ordenação dos resultados
+            prefer_cache: Usa respostas em cache mesmo fora do TTL
+            total_count: Total de audiências já conhecido (ex.: via sonda), usado
+                para encerrar a paginação sem uma requisição extra
+            
+        Yields:
+            Dict: JSON de cada página retornada pela API
+        """
+        page_size = results_per_page or Config.HEARINGS_PAGE_SIZE
+
+        def fetch(page_number: int) -> Dict:
+            return self.search_hearings(
+                api_url=api_url,
+                search_start_date=search_start_date,
+                search_end_date=search_end_date,
+                situation_code=situation_code,
+                page_number=str(page_number),
+                results_per_page=str(page_size),
+                order=order,
+                prefer_cache=prefer_cache
+            )
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='page')
+        try:
+            page_number = 1
+            received = 0
+            pending = executor.submit(fetch, page_number)
+
+            while pending is not None:
+                data = pending.result()
+                results = data.get('resultado') or []
+                total_pages = data.get('qtdPaginas')
+                received += len(results)
+
+                if total_count is not None:
+                    has_next = received < total_count
+                elif total_pages is not None:
+                    has_next = page_number < int(total_pages)
+                else:
+                    # Sem metadados de paginação: página cheia indica que pode haver mais
+                    has_next = len(results) >= page_size
+
+                # Dispara a próxima página antes de entregar a atual
+                pending = executor.submit(fetch, page_number + 1) if has_next and results else None
+
+                self.logger.debug(
+                    f"📄 Página {page_number}"
+                    f"{f'/{total_pages}' if total_pages is not None else ''} "
+                    f"com {len(results)} audiências ({search_start_date} a {search_end_date})"
+                )
+                yield data
+                page_number += 1
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _parse_probe_total(data: Dict) -> Optional[int]:
+        """Extrai o total de audiências da resposta de uma sonda com tamanhoPagina=1."""
+        results = data.get('resultado') or []
+
+        if data.get('totalRegistros') is not None:
+            return int(data['totalRegistros'])
+        if not results:
+            return 0
+        if data.get('qtdPaginas') is not None:
+            # Com uma audiência por página, a quantidade de páginas é o total
+            return int(data['qtdPaginas'])
+        return None
+
+    def probe_hearing_count(
+        self,
+        api_url: str,
+        search_start_date: str,
+        search_end_date: str,
+        situation_code: str = 'M',
+        prefer_cache: bool = False
+    ) -> Optional[int]:
+        """
+        Consulta barata (tamanhoPagina=1) para descobrir quantas audiências há na janela.
+        
+        Returns:
+            Optional[int]: Total de audiências, 0 para janela vazia ou None se a
+            API não informar o total e a janela não estiver vazia
+        """
+        data = self.search_hearings(
+            api_url=api_url,
+            search_start_date=search_start_date,
+            search_end_date=search_end_date,
+            situation_code=situation_code,
+            page_number='1',
+            results_per_page='1',
+            prefer_cache=prefer_cache
+        )
+        total = self._parse_probe_total(data)
+
+        self.logger.debug(
+            f"🔎 Sonda {search_start_date} a {search_end_date}: "
+            f"{total if total is not None else 'total desconhecido'}"
+        )
+        return total
+
+
+class AsyncCourtClient:
+    """
+    Cliente assíncrono (aiohttp) da API de pauta de um tribunal.
+    
+    Oferece a mesma interface de busca da CourtSession, reaproveitando seus
+    cookies, headers e cache de respostas, para que muitas consultas fiquem
+    em andamento ao mesmo tempo em um único event loop.
+    """
+    
+    def __init__(self, court_session: CourtSession) -> None:
+        """Inicializa o cliente a partir de uma CourtSession já autenticada."""
+        if aiohttp is None:
+            raise RuntimeError("HTTP_BACKEND=async requer o pacote aiohttp (pip install aiohttp)")
+        
+        self.court_session = court_session
+        self.tribunal_name = court_session.tribunal_name
+        self.logger = court_session.logger
+        self.rate_limiter = court_session.rate_limiter
+        self.circuit_breaker = court_session.circuit_breaker
+        self._in_flight: Dict[Tuple, asyncio.Task] = {}
+        self._http: Optional[aiohttp.ClientSession] = None
+    
+    async def __aenter__(self) -> AsyncCourtClient:
+        """Abre a sessão HTTP com os cookies da sessão autenticada."""
+        headers = {
+            name: value for name, value in self.court_session.session.headers.items()
+            if name != 'Accept-Encoding'  # aiohttp negocia a compressão que suporta
+        }
+        self._http = aiohttp.ClientSession(
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=Config.REQUEST_TIMEOUT_SECONDS)
+        )
+        self._copy_cookies()
+        return self
+    
+    def _copy_cookies(self) -> None:
+        """
+        Copia os cookies da CourtSession para o CookieJar do aiohttp.
+        
+        Cada cookie mantém domínio, caminho e a flag secure, de modo que os
+        cookies do SSO e os da API (de mesmo nome e domínios diferentes) não
+        se sobrescrevem nem são enviados a hosts que não os emitiram.
+        """
+        for cookie in self.court_session.session.cookies:
+            morsel = Morsel()
+            morsel.set(cookie.name, cookie.value, cookie.value)
+            morsel['path'] = cookie.path or '/'
+            if cookie.domain_specified:
+                morsel['domain'] = cookie.domain
+            if cookie.secure:
+                morsel['secure'] = True
+            # Sem domínio explícito o cookie fica restrito ao host de origem
+            host = cookie.domain.lstrip('.')
+            origin = URL(f'https://{host}/') if host else URL()
+            self._http.cookie_jar.update_cookies({cookie.name: morsel}, response_url=origin)
+    
+    @staticmethod
+    async def gather(*coros) -> List:
+        """
+        Como asyncio.gather, mas cancela as tarefas restantes na primeira falha.
+        
+        Assim uma janela que falha (por exemplo, com o orçamento de tempo
+        esgotado) não deixa páginas ou sub-janelas consultando o tribunal em
+        segundo plano.
+        """
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+    
+    def _sync_credentials(self) -> None:
+        """Copia para a sessão aiohttp os cookies e o token renovados na CourtSession."""
+        self._copy_cookies()
+        authorization = self.court_session.session.headers.get('Authorization')
+        if authorization:
+            self._http.headers['Authorization'] = authorization
+    
+    async def __aexit__(self, *exc_info) -> None:
+        """Fecha a sessão HTTP."""
+        await self._http.close()
+    
+    async def search_hearings(
+        self,
+        api_url: str,
+        search_start_date: str,
+        search_end_date: str,
+        situation_code: str = 'M',
+        page_number: str = '1',
+        results_per_page: str = '1500',
+        order: str = 'asc',
+        prefer_cache: bool = False
+    ) -> Dict:
+        """
+        Realiza busca de audiências na API do tribunal com retry assíncrono.
+        
+        Consultas idênticas simultâneas aguardam a mesma tarefa.
+        """
+        request_key = (
+            api_url, search_start_date, search_end_date, situation_code,
+            str(page_number), str(results_per_page), order, prefer_cache
+        )
+        task = self._in_flight.get(request_key)
+        if task is None:
+            task = asyncio.ensure_future(self._search_with_reauth(*request_key))
+            self._in_flight[request_key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(request_key, None))
+        else:
+            self.logger.debug(
+                f"🔗 Consulta idêntica em andamento: {search_start_date} a {search_end_date}"
+            )
+        return await asyncio.shield(task)
+    
+    async def _search_with_reauth(self, *args) -> Dict:
+        """Versão assíncrona de CourtSession._search_with_reauth."""
+        try:
+            return await self._search_with_retry(*args)
+        except SessionExpiredError as e:
+            if not await asyncio.to_thread(self.court_session.reauthenticate, e.generation):
+                raise
+            self._sync_credentials()
+            self.logger.info(f"🔁 Repetindo consulta ao {self.tribunal_name} com a sessão renovada")
+            return await self._search_with_retry(*args)
+    
+    async def _search_with_retry(
+        self,
+        api_url: str,
+        search_start_date: str,
+        search_end_date: str,
+        situation_code: str,
+        page_number: str,
+        results_per_page: str,
+        order: str,
+        prefer_cache: bool
+    ) -> Dict:
+        """Executa a busca com novas tentativas até o prazo REQUEST_DEADLINE_SECONDS."""
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(3) | stop_after_delay(Config.REQUEST_DEADLINE_SECONDS),
+            wait=wait_exponential(multiplier=1, min=4, max=20),
+            retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)),
+            reraise=True
+        ):
+            with attempt:
+                return await self._search_once(
+                    api_url, search_start_date, search_end_date, situation_code,
+                    page_number, results_per_page, order, prefer_cache
+                )
+    
+    async def _search_once(
+        self,
+        api_url: str,
+        search_start_date: str,
+        search_end_date: str,
+        situation_code: str,
+        page_number: str,
+        results_per_page: str,
+        order: str,
+        prefer_cache: bool
+    ) -> Dict:
+        """Executa uma tentativa de busca, consultando e alimentando o cache de respostas."""
+        params = CourtSession._build_search_params(
+            search_start_date, search_end_date, situation_code,
+            page_number, results_per_page, order
+        )
+        cache_key, cached, headers, cached_data = self.court_session._check_response_cache(
+            api_url, params, prefer_cache, allow_stale=self.circuit_breaker.is_open
+        )
+        if cached_data is not None:
+            return cached_data
+        self.circuit_breaker.check()
+        generation = self.court_session.auth_generation
+        
+        try:
+            self.logger.debug(f"🔍 Buscando audiências: {search_start_date} a {search_end_date}")
+            async with self.rate_limiter.request_async() as outcome:
+                self.court_session.check_budget(outcome, search_start_date, search_end_date)
+                started = time.monotonic()
+                async with self._http.get(api_url, params=params, headers=headers) as response:
+                    outcome['latency'] = time.monotonic() - started
+                    outcome['status'] = response.status
+                    outcome['retry_after'] = response.headers.get('Retry-After')
+                    if response.status in [401, 403]:
+                        self.logger.error(f"❌ Não autenticado (status {response.status})")
+                        raise SessionExpiredError(self.tribunal_name, response.status, generation)
+                    response.raise_for_status()
+                    self.circuit_breaker.record_success()
+                    self.court_session.mark_authenticated()
+                    
+                    if response.status == 304 and cached:
+                        self.logger.debug(
+                            f"📦 Resposta não modificada (304): {search_start_date} a {search_end_date}"
+                        )
+                        data = self.court_session._load_cached(cache_key)
+                        if data is None:
+                            # Entrada descartada: a próxima tentativa consulta sem cabeçalhos condicionais
+                            raise aiohttp.ClientPayloadError("Cache de resposta ilegível após 304")
+                        self.court_session.response_cache.touch(cache_key, cached)
+                        return data
+                    
+                    data = await self._read_response(response, cache_key, cached)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if not isinstance(e, aiohttp.ClientResponseError) or e.status >= 500:
+                self.circuit_breaker.record_failure(e)
+            self.logger.error(f"Erro na requisição à API {api_url}: {e}")
+            raise
+        
+        self.logger.debug(f"✅ {len(data.get('resultado', []))} audiências encontradas")
+        return data
+    
+    async def _read_response(
+        self,
+        response: aiohttp.ClientResponse,
+        cache_key: Optional[str],
+        cached: Optional[Dict]
+    ) -> Dict:
+        """Versão assíncrona de CourtSession._read_response (trechos de response.content)."""
+        decoder = codecs.getincrementaldecoder(response.charset or 'utf-8')(errors='replace')
+        reader = self.court_session._body_reader(cache_key, response.headers)
+        try:
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                reader.feed(decoder.decode(chunk))
+            reader.feed(decoder.decode(b'', final=True))
+        except BaseException:
+            reader.discard()
+            raise
+        data, entry = reader.close()
+        self.court_session._log_cache_match(cached, entry)
+        return data
+    
+    async def probe_hearing_count(
+        self,
+        api_url: str,
+        search_start_date: str,
+        search_end_date: str,
+        situation_code: str = 'M',
+        prefer_cache: bool = False
+    ) -> Optional[int]:
+        """Versão assíncrona de CourtSession.probe_hearing_count."""
+        data = await self.search_hearings(
+            api_url, search_start_date, search_end_date, situation_code,
+            page_number='1', results_per_page='1', prefer_cache=prefer_cache
+        )
+        return CourtSession._parse_probe_total(data)
+    
+    async def fetch_hearing_pages(
+        self,
+        api_url: str,
+        search_start_date: str,
+        search_end_date: str,
+        situation_code: str = 'M',
+        results_per_page: Optional[int] = None,
+        order: str = 'asc',
+        prefer_cache: bool = False,
+        total_count: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Busca todas as páginas de uma consulta.
+        
+        Quando a quantidade de páginas é conhecida (qtdPaginas ou total da
+        sonda), as páginas restantes são solicitadas todas ao mesmo tempo.
+        """
+        page_size = results_per_page or Config.HEARINGS_PAGE_SIZE
+        search = partial(
+            self.search_hearings, api_url, search_start_date, search_end_date, situation_code,
+            results_per_page=str(page_size), order=order, prefer_cache=prefer_cache
+        )
+        
+        first_page = await search(page_number='1')
+        pages = [first_page]
+        results = first_page.get('resultado') or []
+        if not results:
+            return pages
+        
+        total_pages = first_page.get('qtdPaginas')
+        if total_count is not None:
+            total_pages = -(-total_count // page_size)
+        
+        if total_pages is not None:
+            pages.extend(await self.gather(*(
+                search(page_number=str(page_number))
+                for page_number in range(2, int(total_pages) + 1)
+            )))
+            return pages
+        
+        # Sem metadados de paginação: segue enquanto as páginas vierem cheias
+        page_number = 1
+        while len(results) >= page_size:
+            page_number += 1
+            data = await search(page_number=str(page_number))
+            pages.append(data)
+            results = data.get('resultado') or []
+        return pages
+
+
+class SsoLoginManager:
+    """
+    Login único no SSO do PDPJ compartilhado entre os tribunais.
+    
+    Todas as instâncias do PJe autenticam pelo mesmo provedor de identidade
+    (Keycloak/OpenID do PDPJ). O usuário faz o login com 2FA uma única vez, no
+    primeiro tribunal; nos demais, o mesmo navegador aciona o botão SSO-PJ e
+    o provedor, que já reconhece a sessão, redireciona de volta autenticado.
+    """
+    
+    SSO_BUTTON_ID: str = 'btnSsoPdpj'
+    
+    def __init__(
+        self,
+        logger: Optional[HearingLogger] = None,
+        notifier: Optional[EmailNotifier] = None,
+        timeout: int = 300
+    ) -> None:
+        """Inicializa o gerenciador com o tempo máximo do login manual."""
+        self.logger = logger or HearingLogger()
+        self.notifier = notifier or EmailNotifier()
+        self.timeout = timeout
+    
+    def _click_sso_button(self, driver: webdriver.Chrome) -> bool:
+        """Aciona o botão SSO-PJ da página de login, se ele existir."""
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.element_to_be_clickable((By.ID, self.SSO_BUTTON_ID))
+            ).click()
+            return True
+        except TimeoutException:
+            return False
+    
+    @staticmethod
+    def restore_sessions(
+        tribunals: List[Tribunal],
+        sessions: Dict[str, CourtSession]
+    ) -> List[Tribunal]:
+        """
+        Reaproveita (tokens em cache) ou renova sem navegador, em paralelo, a
+        sessão de cada tribunal.
+        
+        Returns:
+            List[Tribunal]: Tribunais que ainda precisam de login no navegador
+        """
+        if not tribunals:
+            return []
+        
+        def restore(tribunal: Tribunal) -> bool:
+            session = sessions[tribunal.name]
+            return session.restore_cached_session() or session.refresh_session()
+        
+        workers = min(len(tribunals), max(1, Config.MAX_PARALLEL_LOGINS))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='login') as executor:
+            restored = list(executor.map(restore, tribunals))
+        return [tribunal for tribunal, ok in zip(tribunals, restored) if not ok]
+    
+    def login_all(self, tribunals: List[Tribunal], sessions: Dict[str, CourtSession]) -> bool:
+        """
+        Autentica todos os tribunais com uma única sessão de navegador.
+        
+        Tribunais com tokens em cache válidos ou cuja sessão pôde ser renovada
+        sem navegador (CourtSession.refresh_session) são ignorados; essas
+        verificações rodam em paralelo. Concluído o primeiro login no
+        navegador, os demais tribunais tentam de novo, em paralelo, a
+        renovação sem navegador com a sessão do SSO recém-capturada. Se o
+        redirecionamento pelo SSO não concluir o login em SSO_REDIRECT_TIMEOUT
+        segundos, o usuário pode completá-lo manualmente na mesma janela.
+        
+        Returns:
+            bool: True se todos os tribunais foram autenticados
+        """
+        pending = self.restore_sessions(tribunals, sessions)
+        if not pending:
+            return True
+        
+        self.logger.info(
+            f"🌐 Login único no SSO do PDPJ para {len(pending)} tribunais: "
+            f"{', '.join(tribunal.name for tribunal in pending)}"
+        )
+        current = pending[0].name
+        try:
+            driver = CourtSession.create_login_driver(self.logger)
+            try:
+                sso_active = False
+                while pending:
+                    tribunal = pending.pop(0)
+                    current = tribunal.name
+                    started = time.monotonic()
+                    driver.get(tribunal.login_url)
+                    clicked = self._click_sso_button(driver)
+                    
+                    reused = sso_active and clicked and CourtSession.wait_for_login(
+                        driver, Config.SSO_REDIRECT_TIMEOUT, domain=tribunal.domain
                     )
-                
-                # Salva tokens no cache para uso futuro
-                self.token_cache.save_tokens(self.tribunal_name, cookies)
-                
-                print("\n✅ Login concluído com sucesso!")
-                print("💾 Tokens salvos para uso futuro\n")
-                
-                return True
-                
+                    if sso_active and not reused:
+                        self.logger.warning(
+                            f"⚠️ Sessão SSO não reaproveitada no {tribunal.name}; login manual necessário"
+                        )
+                    if not reused:
+                        CourtSession.print_login_instructions(
+                            tribunal.name, tribunal.login_url, self.timeout
+                        )
+                        if not CourtSession.wait_for_login(
+                            driver, self.timeout, domain=tribunal.domain
+                        ):
+                            raise TimeoutException(
+                                f"Tempo esgotado aguardando login ({self.timeout}s)"
+                            )
+                    
+                    sessions[tribunal.name].capture_login(driver)
+                    sessions[tribunal.name].record_login(
+                        'SSO reaproveitado' if reused else 'navegador', started
+                    )
+                    if not sso_active and pending and Config.SSO_REFRESH_ENABLED:
+                        pending = self.restore_sessions(pending, sessions)
+                    sso_active = True
             finally:
-                # Fecha o navegador
                 driver.quit()
-                
+            
+            return True
+        
         except TimeoutException:
-            msg = f"⏱️ Tempo esgotado aguardando login em {self.tribunal_name}"
-            self.logger.error(msg, exc_info=False)
-            self.notifier.send(f"Timeout no login de {self.tribunal_name}. O usuário não completou o login a tempo.")
+            self.logger.error(f"⏱️ Tempo esgotado aguardando login em {current}", exc_info=False)
+            self.notifier.send(f"Timeout no login de {current}. O usuário não completou o login a tempo.")
             return False
+        
+        except WebDriverException as e:
+            self.logger.error(f"❌ Erro no WebDriver ao autenticar em {current}: {e}")
+            self.notifier.send(f"Erro no navegador ao tentar login em {current}. Verifique se o Chrome está instalado.")
+            return False
+        
+        except Exception as e:
+            self.logger.error(f"❌ Erro inesperado ao autenticar em {current}: {e}")
+            self.notifier.send(f"Falha no login de {current}. Erro: {e}")
+            return False
+
+
+class SessionKeepAlive:
+    """
+    Mantém as sessões dos tribunais ativas em segundo plano.
+    
+    A cada SESSION_KEEPALIVE_MINUTES, cada sessão é validada (o que também
+    renova a sessão no servidor) e os cookies atualizados são gravados no
+    TokenCache. Sessões que deixaram de ser aceitas ou que expiram antes da
+    próxima verificação são renovadas pelo SSO, sem navegador, e a duração
+    real observada passa a definir a validade das sessões seguintes.
+    """
+    
+    def __init__(
+        self,
+        sessions: Dict[str, CourtSession],
+        interval_minutes: Optional[int] = None,
+        logger: Optional[HearingLogger] = None,
+        notifier: Optional[EmailNotifier] = None
+    ) -> None:
+        """Inicializa o keep-alive das sessões informadas."""
+        self.sessions = sessions
+        self.interval = timedelta(minutes=interval_minutes or Config.SESSION_KEEPALIVE_MINUTES)
+        self.logger = logger or HearingLogger()
+        self.notifier = notifier or EmailNotifier()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lost: Set[str] = set()
+    
+    def check_session(self, name: str, session: CourtSession) -> bool:
+        """
+        Valida uma sessão e a renova se estiver inválida ou perto de expirar.
+        
+        Returns:
+            bool: True se a sessão continua disponível no TokenCache para a
+            próxima execução. Sessões aceitas têm a validade da entrada
+            estendida (ver TokenCache.touch_tokens); falhas de rede na
+            verificação não contam como expiração enquanto a entrada em
+            cache não vencer.
+        """
+        status = session._session_status()
+        if status is None:
+            self.logger.warning(
+                f"⚠️ Não foi possível verificar a sessão do {name}; nova verificação em {self.interval}"
+            )
+            expires_at = session.token_cache.expires_at(name)
+            if expires_at is not None and expires_at > datetime.now():
+                return True
+            return session.refresh_session()
+        
+        if not status:
+            session.token_cache.record_expiry(name)
+            return session.refresh_session()
+        
+        expires_at = session.token_cache.touch_tokens(name, session.session_cookies())
+        if expires_at is not None and expires_at - datetime.now() >= 2 * self.interval:
+            self.logger.debug(f"💓 Sessão do {name} ativa até {expires_at:%d/%m %H:%M}")
+            return True
+        
+        if expires_at is None:
+            self.logger.info(f"⏰ Sessão do {name} ativa, mas ausente do cache de tokens; renovando...")
+        else:
+            self.logger.info(f"⏰ Sessão do {name} expira às {expires_at:%H:%M}; renovando...")
+        if session.refresh_session():
+            return True
+        if expires_at is None:
+            return False
+        self.logger.warning(f"⚠️ Renovação antecipada do {name} indisponível; a sessão segue ativa")
+        return True
+    
+    def check_all(self) -> None:
+        """Verifica todas as sessões, avisando uma única vez sobre as que não puderam ser renovadas."""
+        for name, session in self.sessions.items():
+            try:
+                alive = self.check_session(name, session)
+            except Exception as e:
+                self.logger.error(f"Erro no keep-alive do {name}: {e}")
+                alive = False
+            
+            if alive:
+                self._lost.discard(name)
+            elif name not in self._lost:
+                self._lost.add(name)
+                self.logger.warning(f"⚠️ Sessão do {name} perdida; será necessário novo login")
+                self.notifier.send(
+                    f"A sessão do {name} expirou e não pôde ser renovada automaticamente. "
+                    f"A próxima execução pedirá novo login."
+                )
+    
+    def _loop(self) -> None:
+        """Executa as verificações periódicas até stop()."""
+        while not self._stop.wait(self.interval.total_seconds()):
+            self.check_all()
+    
+    def start(self) -> None:
+        """Inicia as verificações em uma thread de segundo plano."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name='keep-alive', daemon=True)
+        self._thread.start()
+        self.logger.debug(f"💓 Keep-alive das sessões a cada {self.interval}")
+    
+    def stop(self) -> None:
+        """Interrompe as verificações em segundo plano."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+    
+    def run_forever(self) -> None:
+        """Mantém as sessões ativas continuamente (modo --keep-alive), até Ctrl+C."""
+        self.logger.info(
+            f"💓 Mantendo {len(self.sessions)} sessões ativas a cada {self.interval} (Ctrl+C para sair)"
+        )
+        try:
+            self.check_all()
+            self._loop()
+        except KeyboardInterrupt:
+            self.logger.info("👋 Keep-alive encerrado")
+
+
+class Hearing:
+    """
+    Audiência (uma linha da planilha) do backend de dados 'python'.
+
+    Usa __slots__ para ocupar pouca memória; data em date e hora em
+    timedelta (desde a meia-noite), como no esquema tipado do pandas.
+    """
+
+    __slots__ = (
+        'hearing_date', 'hearing_hour', 'court_case_number', 'claimant',
+        'defendant', 'hearing_place', 'hearing_type', 'status'
+    )
+
+    def __init__(
+        self,
+        hearing_date: Optional[date],
+        hearing_hour: Optional[timedelta],
+        court_case_number: Optional[str],
+        claimant: Optional[str],
+        defendant: Optional[str],
+        hearing_place: Optional[str],
+        hearing_type: Optional[str],
+        status: Optional[str]
+    ) -> None:
+        """Cria a audiência com os campos na ordem das colunas da planilha."""
+        self.hearing_date = hearing_date
+        self.hearing_hour = hearing_hour
+        self.court_case_number = court_case_number
+        self.claimant = claimant
+        self.defendant = defendant
+        self.hearing_place = hearing_place
+        self.hearing_type = hearing_type
+        self.status = status
+
+    def __repr__(self) -> str:
+        return f'Hearing({self.values()!r})'
+
+    @staticmethod
+    def parse_hour(value) -> Optional[timedelta]:
+        """Converte uma hora em texto ('HH:MM:SS' ou 'HH:MM') para timedelta."""
+        if not isinstance(value, str):
+            return None
+        parts = value.strip().split(':')
+        if len(parts) not in (2, 3):
+            return None
+        try:
+            numbers = [int(part) for part in parts]
+        except ValueError:
+            return None
+        return timedelta(hours=numbers[0], minutes=numbers[1], seconds=numbers[2] if len(numbers) == 3 else 0)
+
+    @property
+    def key(self) -> Tuple:
+        """Processo e órgão julgador, usados para comparar com a planilha."""
+        return (self.court_case_number, self.hearing_place)
+
+    @property
+    def slot(self) -> Tuple:
+        """Processo, órgão, data, hora e tipo: identifica a audiência marcada."""
+        return (self.court_case_number, self.hearing_place, self.hearing_date, self.hearing_hour, self.hearing_type)
+
+    @property
+    def start(self) -> Optional[datetime]:
+        """Início da audiência (data + hora)."""
+        if self.hearing_date is None or self.hearing_hour is None:
+            return None
+        return datetime.combine(self.hearing_date, datetime.min.time()) + self.hearing_hour
+
+    def values(self) -> Tuple:
+        """Campos na ordem das colunas da planilha."""
+        return tuple(getattr(self, field) for field in self.__slots__)
+
+    def to_row(self) -> List[str]:
+        """Campos formatados no padrão brasileiro, na ordem das colunas."""
+        hour = ''
+        if self.hearing_hour is not None:
+            seconds = int(self.hearing_hour.total_seconds()) % 86400
+            hour = f'{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}'
+        return [
+            self.hearing_date.strftime(HearingDataProcessor.DATE_FORMAT) if self.hearing_date else '',
+            hour,
+            *('' if value is None else value for value in self.values()[2:])
+        ]
+
+
+class HearingTable(list):
+    """
+    Lista de Hearing usada pelo backend de dados 'python'.
+
+    Expõe o pouco da interface de DataFrame usado fora do processador
+    (empty e columns), de modo que as tabelas dos dois backends circulam
+    pelos mesmos pontos do sistema.
+    """
+
+    @property
+    def empty(self) -> bool:
+        """Indica se a tabela não tem audiências."""
+        return not self
+
+    @property
+    def columns(self) -> List[str]:
+        """Nomes das colunas na planilha."""
+        return list(HearingDataProcessor.COLUMN_MAP.values())
+
+
+class HearingChangeSet(NamedTuple):
+    """Diferenças entre as audiências coletadas e as da planilha (tabelas do backend em uso)."""
+    
+    added: pd.DataFrame
+    removed: pd.DataFrame
+    rescheduled: pd.DataFrame
+    retyped: pd.DataFrame
+    status_changed: pd.DataFrame
+    changed: pd.DataFrame
+    
+    def describe(self) -> str:
+        """Resumo das quantidades de cada tipo de diferença, para o log."""
+        return (
+            f"{len(self.added)} novas, {len(self.removed)} removidas, "
+            f"{len(self.rescheduled)} remarcadas, {len(self.retyped)} com tipo alterado, "
+            f"{len(self.status_changed)} com status alterado"
+        )
+
+
+class HearingDataProcessor:
+    """
+    Processador de dados de audiências (backend 'pandas').
+    
+    As audiências ficam em DataFrames com o esquema tipado de to_schema.
+    PlainHearingDataProcessor oferece a mesma interface com estruturas
+    Python simples; create escolhe a implementação conforme DATA_BACKEND.
+    """
+    
+    # Campos da API usados pelo sistema e seus nomes nas planilhas, na ordem das colunas
+    COLUMN_MAP: Dict[str, str] = {
+        'dataInicio': 'Data da Audiência',
+        'pautaAudienciaHorario.horaInicial': 'Hora da Audiência',
+        'processo.numero': 'Número do Processo',
+        'poloAtivo.nome': 'Reclamante',
+        'poloPassivo.nome': 'Reclamado',
+        'processo.orgaoJulgador.descricao': 'Órgão Julgador',
+        'tipo.descricao': 'Tipo',
+        'statusDescricao': 'Status'
+    }
+    
+    # Esquema das colunas: datas em datetime64, horas em timedelta64 e textos repetidos
+    # como categorias. A conversão para texto no padrão brasileiro só acontece ao gravar
+    # nas planilhas e no calendário (to_display).
+    DATE_FORMAT: str = '%d/%m/%Y'
+    TIME_FORMAT: str = '%H:%M:%S'
+    CATEGORY_COLUMNS: List[str] = ['Órgão Julgador', 'Tipo', 'Status']
+    
+    def __init__(self, logger: Optional[HearingLogger] = None):
+        """Inicializa o processador, importando o pandas."""
+        load_pandas()
+        self.logger = logger or HearingLogger()
+        self._project = HearingStreamParser.compile_projection(self.COLUMN_MAP)
+    
+    @classmethod
+    def create(cls, logger: Optional[HearingLogger] = None) -> HearingDataProcessor:
+        """Cria o processador do backend configurado em DATA_BACKEND ('pandas' ou 'python')."""
+        if Config.DATA_BACKEND == 'python':
+            return PlainHearingDataProcessor(logger)
+        return HearingDataProcessor(logger)
+    
+    @staticmethod
+    def parse_times(values) -> pd.Series:
+        """Converte horas em texto ('HH:MM:SS' ou 'HH:MM') para timedelta64."""
+        times = pd.Series(values, dtype=object)
+        times = times.str.replace(r'^(\d{1,2}:\d{2})$', r'\1:00', regex=True)
+        return pd.to_timedelta(times, errors='coerce')
+    
+    @classmethod
+    def to_schema(cls, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Converte audiências para o esquema tipado.
+        
+        Aceita tanto DataFrames já tipados quanto os lidos da planilha (datas
+        e horas como texto); colunas já no tipo certo não são convertidas.
+        """
+        if dataframe.empty:
+            return dataframe
+        
+        columns = {}
+        if 'Data da Audiência' in dataframe and not pd.api.types.is_datetime64_any_dtype(
+            dataframe['Data da Audiência']
+        ):
+            columns['Data da Audiência'] = pd.to_datetime(
+                dataframe['Data da Audiência'], format=cls.DATE_FORMAT, errors='coerce'
+            )
+        if 'Hora da Audiência' in dataframe and not pd.api.types.is_timedelta64_dtype(
+            dataframe['Hora da Audiência']
+        ):
+            columns['Hora da Audiência'] = cls.parse_times(dataframe['Hora da Audiência'])
+        for column in cls.CATEGORY_COLUMNS:
+            if column in dataframe and not isinstance(dataframe[column].dtype, pd.CategoricalDtype):
+                columns[column] = dataframe[column].astype('category')
+        
+        return dataframe.assign(**columns) if columns else dataframe
+    
+    @classmethod
+    def to_display(cls, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """Formata as audiências como texto no padrão brasileiro, para planilhas e calendário."""
+        columns = {}
+        for column in dataframe.columns:
+            values = dataframe[column]
+            if pd.api.types.is_datetime64_any_dtype(values):
+                values = values.dt.strftime(cls.DATE_FORMAT)
+            elif pd.api.types.is_timedelta64_dtype(values):
+                values = (pd.Timestamp(0) + values).dt.strftime(cls.TIME_FORMAT)
+            else:
+                values = values.astype(object)
+            columns[column] = values.where(values.notna(), '')
+        return pd.DataFrame(columns, index=dataframe.index)
+    
+    @classmethod
+    def start_times(cls, dataframe: pd.DataFrame) -> List[Optional[datetime]]:
+        """Início de cada audiência (data + hora), na ordem do DataFrame."""
+        typed = cls.to_schema(dataframe)
+        starts = typed['Data da Audiência'] + typed['Hora da Audiência']
+        return [None if pd.isna(start) else start.to_pydatetime() for start in starts]
+    
+    def empty_table(self) -> pd.DataFrame:
+        """Tabela de audiências vazia."""
+        return pd.DataFrame()
+    
+    def from_sheet_values(self, values: List[List[str]]) -> pd.DataFrame:
+        """Converte os valores lidos da planilha (cabeçalho e linhas) para o esquema tipado."""
+        return self.to_schema(pd.DataFrame(values[1:], columns=values[0]))
+    
+    def display_rows(self, dataframe: pd.DataFrame) -> List[List[str]]:
+        """Linhas formatadas no padrão brasileiro, na ordem das colunas."""
+        return self.to_display(dataframe).values.tolist()
+    
+    def concat_tables(self, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """Concatena DataFrames parciais ignorando os vazios."""
+        frames = [df for df in frames if not df.empty]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+    
+    def content_hash(self, dataframe: pd.DataFrame) -> str:
+        """Calcula um hash do conteúdo de uma janela para o histórico de alterações."""
+        if dataframe.empty:
+            return hashlib.sha256(b'').hexdigest()
+        hashes = pd.util.hash_pandas_object(dataframe, index=False).values
+        return hashlib.sha256(hashes.tobytes()).hexdigest()
+    
+    def sort_by_date(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """Ordena por data de audiência, mantendo a ordem atual no mesmo dia."""
+        return dataframe.sort_values('Data da Audiência', kind='stable')
+    
+    def select_dates(self, dataframe: pd.DataFrame, ranges: List[Tuple[date, date]]) -> pd.DataFrame:
+        """Audiências cujas datas caem em algum dos períodos informados (inclusivos)."""
+        dates = dataframe['Data da Audiência']
+        keep = pd.Series(False, index=dataframe.index)
+        for start, end in ranges:
+            keep |= dates.between(pd.Timestamp(start), pd.Timestamp(end))
+        return dataframe[keep]
+    
+    def json_to_dataframe(self, json_data: Union[Dict, List[Dict]]) -> pd.DataFrame:
+        """
+        Converte dados JSON de audiências para DataFrame.
+        
+        Apenas os campos de COLUMN_MAP são lidos de cada registro (ou já vêm
+        extraídos pelo parser incremental) e montados coluna a coluna, sem
+        normalizar a árvore completa de cada audiência.
+        """
+        if not json_data or 'resultado' not in json_data:
+            self.logger.warning("JSON vazio ou sem campo 'resultado'")
+            return pd.DataFrame()
+        
+        try:
+            records = json_data['resultado'] or []
+            if json_data.get(HearingStreamParser.COMPACT_ROWS_KEY):
+                # Página já reduzida pelo parser incremental: linhas com os campos na ordem de COLUMN_MAP
+                rows = records
+            else:
+                rows = list(map(self._project, records))
             
-        except WebDriverException as e:
-            msg = f"❌ Erro no WebDriver ao autenticar em {self.tribunal_name}: {e}"
-            self.logger.error(msg)
-            self.notifier.send(f"Erro no navegador ao tentar login em {self.tribunal_name}. Verifique se o Chrome está instalado.")
-            return False
+            if not rows:
+                self.logger.debug("DataFrame vazio após normalização")
+                return pd.DataFrame()
+            
+            # Transpõe as linhas em colunas, já com os nomes usados nas planilhas
+            columns = dict(zip(self.COLUMN_MAP.values(), (list(values) for values in zip(*rows))))
+            
+            # Data da audiência (sem horário nem fuso); horas e categorias em to_schema
+            dates = pd.to_datetime(columns['Data da Audiência'], format='ISO8601', errors='coerce')
+            if dates.tz is not None:
+                dates = dates.tz_localize(None)
+            columns['Data da Audiência'] = dates.normalize()
+            
+            dataframe = self.to_schema(pd.DataFrame(columns))
+            
+            # Remove linhas com valores nulos em campos críticos
+            dataframe = dataframe.dropna(subset=['Data da Audiência', 'Número do Processo'])
+            
+            self.logger.debug(f"✅ DataFrame processado: {len(dataframe)} registros válidos")
+            return dataframe
             
         except Exception as e:
-            msg = f"❌ Erro inesperado ao autenticar em {self.tribunal_name}: {e}"
-            self.logger.error(msg)
-            self.notifier.send(f"Falha no login de {self.tribunal_name}. Erro: {e}")
-            return False
+            self.logger.error(f"Erro ao processar dados JSON: {e}")
+            return pd.DataFrame()
     
-    def _validate_session(self) -> bool:
-        """Valida se a sessão atual ainda está ativa."""
+    # Identificação de uma audiência na comparação entre a planilha e a coleta
+    HEARING_KEY: List[str] = ['Número do Processo', 'Órgão Julgador']
+    HEARING_SLOT: List[str] = HEARING_KEY + ['Data da Audiência', 'Hora da Audiência', 'Tipo']
+    
+    def diff_hearings(self, new_df: pd.DataFrame, old_df: pd.DataFrame) -> 'HearingChangeSet':
+        """
+        Compara a coleta atual com a planilha e classifica as diferenças.
+        
+        A comparação é feita por junções sobre (Número do Processo, Órgão
+        Julgador), sem percorrer as linhas: uma audiência da planilha sem
+        correspondência exata (mesma data, hora e tipo) na coleta foi alterada
+        se o processo ainda tem audiência no mesmo órgão, ou removida caso
+        contrário. As alteradas são classificadas em remarcadas (data ou hora)
+        e com tipo alterado; as mudanças só de status são informadas à parte.
+        """
+        empty = pd.DataFrame(columns=old_df.columns if not old_df.empty else new_df.columns)
+        if new_df.empty or old_df.empty:
+            return HearingChangeSet(
+                added=new_df if old_df.empty else empty,
+                removed=old_df if new_df.empty else empty,
+                rescheduled=empty, retyped=empty, status_changed=empty, changed=empty
+            )
+        
+        key, slot = self.HEARING_KEY, self.HEARING_SLOT
+        new_slots = new_df[slot + ['Status']].drop_duplicates(subset=slot)
+        
+        # Audiências da planilha: correspondência exata e existência do processo na coleta
+        old = old_df.merge(
+            new_slots.rename(columns={'Status': '_status_novo'}),
+            on=slot, how='left', indicator='_exata'
+        )
+        old = old.merge(new_df[key].drop_duplicates(), on=key, how='left', indicator='_chave')
+        matched = (old['_exata'] == 'both').to_numpy()
+        known = (old['_chave'] == 'both').to_numpy()
+        
+        # Audiências novas: sem correspondência exata e de processo/órgão ausente da planilha
+        new = new_df.merge(old_df[slot].drop_duplicates(), on=slot, how='left', indicator='_exata')
+        new = new.merge(old_df[key].drop_duplicates(), on=key, how='left', indicator='_chave')
+        new_unmatched = new[new['_exata'] == 'left_only']
+        
+        # Compara cada audiência alterada com a nova audiência do mesmo processo e órgão
+        changed = old[~matched & known]
+        counterpart = changed[key].merge(
+            new_unmatched[slot].drop_duplicates(subset=key).rename(columns={
+                column: f'{column}_novo' for column in slot if column not in key
+            }),
+            on=key, how='left'
+        )
+        moved = (
+            (changed['Data da Audiência'].to_numpy() != counterpart['Data da Audiência_novo'].to_numpy())
+            | (changed['Hora da Audiência'].to_numpy() != counterpart['Hora da Audiência_novo'].to_numpy())
+        )
+        retyped = changed['Tipo'].to_numpy() != counterpart['Tipo_novo'].to_numpy()
+        status_changed = matched & (
+            old['Status'].astype(object).fillna('').to_numpy()
+            != old['_status_novo'].astype(object).fillna('').to_numpy()
+        )
+        
+        columns = list(old_df.columns)
+        change_set = HearingChangeSet(
+            added=new_unmatched.loc[new_unmatched['_chave'] == 'left_only', list(new_df.columns)]
+                .reset_index(drop=True),
+            removed=old.loc[~matched & ~known, columns].reset_index(drop=True),
+            rescheduled=changed.loc[moved, columns].reset_index(drop=True),
+            retyped=changed.loc[retyped, columns].reset_index(drop=True),
+            status_changed=old.loc[status_changed, columns].reset_index(drop=True),
+            changed=changed[columns].reset_index(drop=True)
+        )
+        self.logger.debug(f"🔍 Comparação concluída: {change_set.describe()}")
+        return change_set
+    
+    def find_changed_hearings(self, new_df: pd.DataFrame, old_df: pd.DataFrame) -> pd.DataFrame:
+        """Identifica audiências que tiveram alterações (de data, hora ou tipo)."""
+        if new_df.empty or old_df.empty:
+            self.logger.debug("DataFrames vazios - sem alterações para detectar")
+            return self.empty_table()
+        
+        self.logger.info("🔍 Procurando audiências alteradas...")
+        change_set = self.diff_hearings(new_df, old_df)
+        result = change_set.changed
+        
+        if not result.empty:
+            self.logger.info(f"⚠️ Encontradas {len(result)} audiências alteradas")
+        else:
+            self.logger.info("✅ Nenhuma alteração detectada")
+        self.logger.info(f"📋 {change_set.describe()}")
+            
+        return result
+    
+    def combine_dataframes(self, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Combina qualquer número de DataFrames e ordena por data de audiência.
+        
+        Faz uma única concatenação, remoção de duplicatas e ordenação, em vez
+        de repetir todo o trabalho a cada par de DataFrames. O resultado segue
+        o esquema tipado (ver to_schema).
+        """
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame()
+        
         try:
-            # Tenta fazer uma requisição simples para verificar se está autenticado
-            # Ajuste a URL conforme necessário para o seu caso
-            test_url = f"https://pje.{self.tribunal_name.lower()}.jus.br/primeirograu/"
-            response = self.session.get(test_url, timeout=10, allow_redirects=False)
+            # Categorias diferentes entre os DataFrames viram texto no concat; to_schema as refaz
+            combined_df = self.to_schema(pd.concat(frames, ignore_index=True))
+            
+            # Remove duplicatas (mesmo processo, local, data e hora)
+            combined_df = combined_df.drop_duplicates(
+                subset=['Número do Processo', 'Órgão Julgador', 'Data da Audiência', 'Hora da Audiência'],
+                keep='first'
+            )
+            
+            # Ordena por data (estável: mantém a ordem de chegada no mesmo dia)
+            combined_df = combined_df.sort_values(by='Data da Audiência', kind='stable')
+            
+            self.logger.debug(f"✅ {len(frames)} DataFrames combinados: {len(combined_df)} registros únicos")
+            return combined_df
             
-            # Se retornar 200 ou 302 (não 401/403), considera válido
-            if response.status_code in [200, 302]:
-                self.logger.debug(f"✅ Sessão válida para {self.tribunal_name}")
-                return True
-            else:
-                self.logger.debug(f"❌ Sessão inválida (status {response.status_code})")
-                return False
         except Exception as e:
-            self.logger.debug(f"❌ Erro ao validar sessão: {e}")
-            return False
+            self.logger.error(f"Erro ao combinar DataFrames: {e}")
+            return pd.DataFrame()
     
-    @tenacity_retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=20),
-        retry=retry_if_exception_type(requests.exceptions.RequestException)
-    )
-    def search_hearings(
-        self, 
-        api_url: str,
-        search_start_date: str,
-        search_end_date: str,
-        situation_code: str = 'M',
-        page_number: str = '1',
-        results_per_page: str = '1500',
-        order: str = 'asc'
-    ) -> Dict:
-        """Realiza busca de audiências na API do tribunal com retry automático."""
-        params = {
-            'dataFim': search_end_date,
-            'dataInicio': search_start_date,
-            'codigoSituacao': situation_code,
-            'numeroPagina': page_number,
-            'tamanhoPagina': results_per_page,
-            'ordenacao': order
-        }
-        
+    def combine_and_sort_dataframes(self, df1: pd.DataFrame, df2: pd.DataFrame) -> pd.DataFrame:
+        """Combina dois DataFrames e ordena por data de audiência."""
+        return self.combine_dataframes([df1, df2])
+
+
+class PlainHearingDataProcessor(HearingDataProcessor):
+    """
+    Processador de dados de audiências sem pandas (backend 'python').
+
+    Mesma interface de HearingDataProcessor, com as audiências em
+    HearingTable (listas de Hearing). Para alguns milhares de audiências as
+    operações são igualmente rápidas e a inicialização não importa
+    pandas/numpy, o que reduz o tempo de partida e a memória.
+    """
+
+    def __init__(self, logger: Optional[HearingLogger] = None):
+        """Inicializa o processador (sem importar o pandas)."""
+        self.logger = logger or HearingLogger()
+        self._project = HearingStreamParser.compile_projection(self.COLUMN_MAP)
+
+    @staticmethod
+    def _parse_api_date(value) -> Optional[date]:
+        """Data de uma audiência a partir do 'dataInicio' da API (ISO 8601)."""
         try:
-            self.logger.debug(f"🔍 Buscando audiências: {search_start_date} a {search_end_date}")
-            response = self.session.get(api_url, params=params, timeout=30)
-            response.raise_for_status()
+            return date.fromisoformat(value[:10])
+        except (TypeError, ValueError):
+            return None
+
+    @classmethod
+    def _parse_sheet_date(cls, value) -> Optional[date]:
+        """Data de uma audiência a partir do texto da planilha (DD/MM/AAAA)."""
+        try:
+            return datetime.strptime(value, cls.DATE_FORMAT).date()
+        except (TypeError, ValueError):
+            return None
+
+    def json_to_dataframe(self, json_data: Union[Dict, List[Dict]]) -> HearingTable:
+        """Converte dados JSON de audiências para HearingTable."""
+        if not json_data or 'resultado' not in json_data:
+            self.logger.warning("JSON vazio ou sem campo 'resultado'")
+            return HearingTable()
+
+        records = json_data['resultado'] or []
+        if json_data.get(HearingStreamParser.COMPACT_ROWS_KEY):
+            rows = records
+        else:
+            rows = map(self._project, records)
+
+        table = HearingTable()
+        for hearing_date, hearing_hour, court_case_number, *fields in rows:
+            hearing_date = self._parse_api_date(hearing_date)
+            # Remove linhas com valores nulos em campos críticos
+            if hearing_date is None or court_case_number is None:
+                continue
+            table.append(Hearing(hearing_date, Hearing.parse_hour(hearing_hour), court_case_number, *fields))
+
+        self.logger.debug(f"✅ Tabela processada: {len(table)} registros válidos")
+        return table
+
+    def to_schema(self, table: HearingTable) -> HearingTable:
+        """As tabelas deste backend já são tipadas."""
+        return table
+
+    def start_times(self, table: HearingTable) -> List[Optional[datetime]]:
+        """Início de cada audiência (data + hora), na ordem da tabela."""
+        return [hearing.start for hearing in table]
+
+    def empty_table(self) -> HearingTable:
+        """Tabela de audiências vazia."""
+        return HearingTable()
+
+    def from_sheet_values(self, values: List[List[str]]) -> HearingTable:
+        """Converte os valores lidos da planilha (cabeçalho e linhas) em audiências."""
+        headers = values[0]
+        positions = [
+            headers.index(column) if column in headers else None
+            for column in self.COLUMN_MAP.values()
+        ]
+        table = HearingTable()
+        for row in values[1:]:
+            fields = [
+                row[position] if position is not None and position < len(row) else None
+                for position in positions
+            ]
+            table.append(Hearing(
+                self._parse_sheet_date(fields[0]), Hearing.parse_hour(fields[1]), *fields[2:]
+            ))
+        return table
+
+    def display_rows(self, table: HearingTable) -> List[List[str]]:
+        """Linhas formatadas no padrão brasileiro, na ordem das colunas."""
+        return [hearing.to_row() for hearing in table]
+
+    def concat_tables(self, tables: List[HearingTable]) -> HearingTable:
+        """Concatena tabelas parciais ignorando as vazias."""
+        return HearingTable(hearing for table in tables for hearing in table)
+
+    def content_hash(self, table: HearingTable) -> str:
+        """Calcula um hash do conteúdo de uma janela para o histórico de alterações."""
+        digest = hashlib.sha256()
+        for hearing in table:
+            digest.update(repr(hearing.values()).encode('utf-8'))
+        return digest.hexdigest()
+
+    def sort_by_date(self, table: HearingTable) -> HearingTable:
+        """Ordena por data de audiência, mantendo a ordem atual no mesmo dia."""
+        return HearingTable(sorted(
+            table, key=lambda hearing: (hearing.hearing_date is None, hearing.hearing_date or date.min)
+        ))
+
+    def select_dates(self, table: HearingTable, ranges: List[Tuple[date, date]]) -> HearingTable:
+        """Audiências cujas datas caem em algum dos períodos informados (inclusivos)."""
+        return HearingTable(
+            hearing for hearing in table
+            if hearing.hearing_date is not None
+            and any(start <= hearing.hearing_date <= end for start, end in ranges)
+        )
+
+    def combine_dataframes(self, tables: List[HearingTable]) -> HearingTable:
+        """Combina qualquer número de tabelas, sem duplicatas, ordenadas por data de audiência."""
+        unique: Dict[Tuple, Hearing] = {}
+        for table in tables:
+            for hearing in table:
+                # Duplicatas: mesmo processo, local, data e hora
+                unique.setdefault(hearing.slot[:4], hearing)
+
+        combined = self.sort_by_date(unique.values())
+        self.logger.debug(f"✅ {len(tables)} tabelas combinadas: {len(combined)} registros únicos")
+        return combined
+
+    def diff_hearings(self, new_table: HearingTable, old_table: HearingTable) -> HearingChangeSet:
+        """
+        Compara a coleta atual com a planilha e classifica as diferenças.
+
+        Mesmas regras de HearingDataProcessor.diff_hearings, com conjuntos e
+        dicionários indexados por (Número do Processo, Órgão Julgador).
+        """
+        if new_table.empty or old_table.empty:
+            return HearingChangeSet(
+                added=new_table if old_table.empty else HearingTable(),
+                removed=old_table if new_table.empty else HearingTable(),
+                rescheduled=HearingTable(), retyped=HearingTable(),
+                status_changed=HearingTable(), changed=HearingTable()
+            )
+
+        new_status: Dict[Tuple, Optional[str]] = {}
+        for hearing in new_table:
+            new_status.setdefault(hearing.slot, hearing.status)
+        new_keys = {hearing.key for hearing in new_table}
+        old_slots = {hearing.slot for hearing in old_table}
+        old_keys = {hearing.key for hearing in old_table}
+
+        # Audiências novas e, por processo/órgão, a primeira audiência sem correspondência exata
+        added = HearingTable()
+        counterparts: Dict[Tuple, Hearing] = {}
+        for hearing in new_table:
+            if hearing.slot in old_slots:
+                continue
+            counterparts.setdefault(hearing.key, hearing)
+            if hearing.key not in old_keys:
+                added.append(hearing)
+
+        removed, rescheduled, retyped = HearingTable(), HearingTable(), HearingTable()
+        status_changed, changed = HearingTable(), HearingTable()
+        for hearing in old_table:
+            if hearing.slot in new_status:
+                if (hearing.status or '') != (new_status[hearing.slot] or ''):
+                    status_changed.append(hearing)
+            elif hearing.key in new_keys:
+                changed.append(hearing)
+                counterpart = counterparts.get(hearing.key)
+                if counterpart is None or (hearing.hearing_date, hearing.hearing_hour) != (
+                    counterpart.hearing_date, counterpart.hearing_hour
+                ):
+                    rescheduled.append(hearing)
+                if counterpart is None or hearing.hearing_type != counterpart.hearing_type:
+                    retyped.append(hearing)
+            else:
+                removed.append(hearing)
+
+        change_set = HearingChangeSet(
+            added=added, removed=removed, rescheduled=rescheduled,
+            retyped=retyped, status_changed=status_changed, changed=changed
+        )
+        self.logger.debug(f"🔍 Comparação concluída: {change_set.describe()}")
+        return change_set
+
+
+class WindowPlanner:
+    """Planejador de janelas de datas consultadas na API de pauta."""
+
+    @staticmethod
+    def half_month_end(day: date) -> date:
+        """
+        Último dia da quinzena de uma data (dia 15 ou último dia do mês).
+        
+        Alinhar os limites das janelas às quinzenas mantém os períodos (e as
+        chaves do cache de respostas) estáveis entre execuções de dias seguidos.
+        """
+        if day.day <= 15:
+            return date(day.year, day.month, 15)
+        next_month = date(day.year + day.month // 12, day.month % 12 + 1, 1)
+        return next_month - timedelta(days=1)
+
+    @staticmethod
+    def merge(ranges: List[Tuple[date, date]]) -> List[Tuple[date, date]]:
+        """Une períodos sobrepostos ou contíguos, devolvendo-os ordenados."""
+        merged: List[Tuple[date, date]] = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1] + timedelta(days=1):
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    @staticmethod
+    def plan(
+        start_date: date,
+        end_date: date,
+        boundaries: List[date],
+        cached: Optional[List[Tuple[date, date]]] = None
+    ) -> List[Tuple[date, date, bool]]:
+        """
+        Monta o conjunto mínimo de janelas disjuntas que cobre o horizonte.
+        
+        Janelas em cache contidas no horizonte são reaproveitadas com os mesmos
+        limites (para que as respostas em cache correspondam); as que se
+        sobrepõem a outra já escolhida são descartadas. Os intervalos restantes
+        são cortados nos limites informados.
+        
+        Args:
+            start_date: Início do horizonte (inclusivo)
+            end_date: Fim do horizonte (inclusivo)
+            boundaries: Datas de fim das janelas a consultar (ex.: fim do ano)
+            cached: Períodos que podem ser servidos do cache
             
-            data = response.json()
-            total = len(data.get('resultado', []))
-            self.logger.debug(f"✅ {total} audiências encontradas")
+        Returns:
+            List[Tuple[date, date, bool]]: Janelas (início, fim, do cache) ordenadas por data
+        """
+        reused: List[Tuple[date, date]] = []
+        for cached_start, cached_end in sorted(cached or []):
+            if cached_start < start_date or cached_end > end_date:
+                continue
+            if reused and cached_start <= reused[-1][1]:
+                continue
+            reused.append((cached_start, cached_end))
+
+        windows = [(cached_start, cached_end, True) for cached_start, cached_end in reused]
+        cuts = sorted({boundary for boundary in boundaries if start_date <= boundary < end_date})
+
+        # Intervalos do horizonte não cobertos pelo cache
+        gap_start = start_date
+        for covered_start, covered_end in reused + [(end_date + timedelta(days=1), end_date)]:
+            if gap_start < covered_start:
+                window_start = gap_start
+                for cut in cuts:
+                    if window_start <= cut < covered_start - timedelta(days=1):
+                        windows.append((window_start, cut, False))
+                        window_start = cut + timedelta(days=1)
+                windows.append((window_start, covered_start - timedelta(days=1), False))
+            gap_start = max(gap_start, covered_end + timedelta(days=1))
+
+        return sorted(windows)
+
+    @staticmethod
+    def split(start_date: date, end_date: date) -> List[Tuple[date, date]]:
+        """
+        Divide uma janela de datas em sub-janelas menores.
+        
+        A divisão segue a granularidade ano → semestre → mês → metades de mês,
+        respeitando os limites da janela original.
+        
+        Args:
+            start_date: Data inicial (inclusiva)
+            end_date: Data final (inclusiva)
             
-            return data
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code in [401, 403]:
-                self.logger.error(f"❌ Não autenticado. Limpando tokens...")
-                self.token_cache.clear_tokens(self.tribunal_name)
-            self.logger.error(f"Erro HTTP na API {api_url}: {e}")
-            raise
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Erro na requisição à API {api_url}: {e}")
-            raise
+        Returns:
+            List[Tuple[date, date]]: Sub-janelas contíguas ou lista vazia se a
+            janela tiver um único dia e não puder mais ser dividida
+        """
+        if end_date <= start_date:
+            return []
+
+        # Primeiro dia de cada mês coberto pela janela
+        month_starts = []
+        current = date(start_date.year, start_date.month, 1)
+        while current <= end_date:
+            month_starts.append(current)
+            current = date(current.year + current.month // 12, current.month % 12 + 1, 1)
+
+        if len(month_starts) > 6:
+            # Ano (ou período longo) → dois semestres
+            boundaries = [month_starts[len(month_starts) // 2]]
+        elif len(month_starts) > 1:
+            # Semestre → meses
+            boundaries = month_starts[1:]
+        else:
+            # Mês → duas metades
+            boundaries = [start_date + timedelta(days=(end_date - start_date).days // 2 + 1)]
+
+        windows = []
+        window_start = start_date
+        for boundary in boundaries:
+            windows.append((window_start, boundary - timedelta(days=1)))
+            window_start = boundary
+        windows.append((window_start, end_date))
+        return windows
+
+    @staticmethod
+    def is_saturated(page: Dict, threshold: Optional[int] = None) -> bool:
+        """
+        Indica se a janela consultada excede o limite de registros por janela.
+        
+        Usa os metadados de paginação da API quando disponíveis e, na falta
+        deles, considera saturada a página que atingiu o limite.
+        """
+        threshold = threshold or Config.WINDOW_SPLIT_THRESHOLD
+        results = page.get('resultado') or []
+
+        total = page.get('totalRegistros')
+        if total is None and page.get('qtdPaginas') is not None:
+            total = int(page['qtdPaginas']) * len(results)
+        if total is None:
+            total = len(results)
+
+        return int(total) >= threshold
+
+
+class RefreshScheduler:
+    """Política de atualização das janelas de datas por distância e histórico de alterações."""
+
+    def __init__(self, state_file: str = None, logger: Optional[HearingLogger] = None) -> None:
+        """Inicializa o agendador carregando o histórico das janelas."""
+        self.state_file = Path(state_file or Config.REFRESH_STATE_FILE)
+        self.logger = logger or HearingLogger()
+        self._lock = threading.Lock()
+        self._state: Dict[str, Dict] = self._load_state()
+
+    def _load_state(self) -> Dict:
+        """Carrega o histórico de atualizações do disco."""
+        if not self.state_file.exists():
+            return {}
+
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Erro ao ler histórico de atualizações: {e}")
+            return {}
 
+    @staticmethod
+    def _parse_key(window_key: str) -> Optional[Tuple[str, date, date]]:
+        """Decompõe a chave de uma janela em (tribunal, início, fim)."""
+        try:
+            tribunal, start, end = window_key.split('|')
+            return tribunal, date.fromisoformat(start), date.fromisoformat(end)
+        except ValueError:
+            return None
 
-class HearingDataProcessor:
-    """Processador de dados de audiências."""
-    
-    def __init__(self, logger: Optional[HearingLogger] = None):
-        """Inicializa o processador."""
-        self.logger = logger or HearingLogger()
-    
-    def json_to_dataframe(self, json_data: Union[Dict, List[Dict]]) -> pd.DataFrame:
-        """Converte dados JSON de audiências para DataFrame."""
-        if not json_data or 'resultado' not in json_data:
-            self.logger.warning("JSON vazio ou sem campo 'resultado'")
-            return pd.DataFrame()
-        
+    def save(self) -> None:
+        """Grava o histórico de atualizações no disco, descartando janelas já passadas."""
+        today = date.today()
         try:
-            # Cria DataFrame a partir dos dados normalizados
-            dataframe = pd.DataFrame(pd.json_normalize(json_data['resultado']))
-            
-            if dataframe.empty:
-                self.logger.debug("DataFrame vazio após normalização")
-                return pd.DataFrame()
-            
-            # Seleciona apenas as colunas desejadas
-            columns = [
-                'dataInicio',
-                'pautaAudienciaHorario.horaInicial',
-                'processo.numero',
-                'poloAtivo.nome',
-                'poloPassivo.nome',
-                'processo.orgaoJulgador.descricao',
-                'tipo.descricao',
-                'statusDescricao'
-            ]
-            
-            # Verifica se todas as colunas existem
-            missing_cols = [col for col in columns if col not in dataframe.columns]
-            if missing_cols:
-                self.logger.warning(f"Colunas ausentes: {missing_cols}")
-                # Cria colunas vazias para as que estão faltando
-                for col in missing_cols:
-                    dataframe[col] = None
-            
-            dataframe = dataframe[columns]
-            
-            # Formata a data para o padrão brasileiro
-            if 'dataInicio' in dataframe.columns:
-                dataframe['dataInicio'] = pd.to_datetime(dataframe['dataInicio'], errors='coerce')
-                dataframe['dataInicio'] = dataframe['dataInicio'].dt.strftime('%d/%m/%Y')
-            
-            # Renomeia as colunas para melhor legibilidade
-            dataframe.rename(columns={
-                'dataInicio': 'Data da Audiência',
-                'pautaAudienciaHorario.horaInicial': 'Hora da Audiência',
-                'processo.numero': 'Número do Processo',
-                'poloAtivo.nome': 'Reclamante',
-                'poloPassivo.nome': 'Reclamado',
-                'processo.orgaoJulgador.descricao': 'Órgão Julgador',
-                'tipo.descricao': 'Tipo',
-                'statusDescricao': 'Status'
-            }, inplace=True)
-            
-            # Remove linhas com valores nulos em campos críticos
-            dataframe = dataframe.dropna(subset=['Data da Audiência', 'Número do Processo'])
-            
-            self.logger.debug(f"✅ DataFrame processado: {len(dataframe)} registros válidos")
-            return dataframe
-            
+            with self._lock:
+                for window_key in list(self._state):
+                    parsed = self._parse_key(window_key)
+                    if parsed is None or parsed[2] < today:
+                        del self._state[window_key]
+                self.state_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.state_file, 'w', encoding='utf-8') as f:
+                    json.dump(self._state, f, indent=2, ensure_ascii=False)
         except Exception as e:
-            self.logger.error(f"Erro ao processar dados JSON: {e}")
-            return pd.DataFrame()
-    
-    def find_changed_hearings(self, new_df: pd.DataFrame, old_df: pd.DataFrame) -> pd.DataFrame:
-        """Identifica audiências que tiveram alterações."""
-        if new_df.empty or old_df.empty:
-            self.logger.debug("DataFrames vazios - sem alterações para detectar")
-            return pd.DataFrame()
-        
-        self.logger.info("🔍 Procurando audiências alteradas...")
-        result = pd.DataFrame()
-        
-        for _, row in new_df.iterrows():
-            # Extrai dados da linha atual
-            court_case_number = row['Número do Processo']
-            hearing_date = row['Data da Audiência']
-            hearing_type = row['Tipo']
-            hearing_hour = row['Hora da Audiência']
-            hearing_place = row['Órgão Julgador']
-            
-            # Busca por diferenças no dataframe antigo
-            matching_rows = old_df[
-                (old_df['Número do Processo'] == court_case_number) &
-                (old_df['Órgão Julgador'] == hearing_place)
-            ]
-            
-            # Filtra apenas as linhas com alterações em data, tipo ou hora
-            changed_rows = matching_rows[
-                (matching_rows['Data da Audiência'] != hearing_date) |
-                (matching_rows['Tipo'] != hearing_type) |
-                (matching_rows['Hora da Audiência'] != hearing_hour)
-            ]
-            
-            # Adiciona as linhas alteradas ao resultado
-            if not changed_rows.empty:
-                result = pd.concat([result, changed_rows], ignore_index=True)
+            self.logger.error(f"Erro ao salvar histórico de atualizações: {e}")
+
+    def refresh_interval(self, window_key: str, window_start: date) -> timedelta:
+        """
+        Calcula o intervalo de atualização de uma janela.
         
-        if not result.empty:
-            self.logger.info(f"⚠️ Encontradas {len(result)} audiências alteradas")
+        O intervalo base depende da distância entre hoje e o início da janela
+        (quente, morna ou fria). Janelas que mudam na maioria das verificações
+        têm o intervalo reduzido à metade; as que nunca mudaram, dobrado.
+        """
+        days_ahead = (window_start - date.today()).days
+        if days_ahead <= Config.REFRESH_HOT_DAYS:
+            interval = timedelta(minutes=Config.REFRESH_HOT_MINUTES)
+        elif days_ahead <= Config.REFRESH_WARM_DAYS:
+            interval = timedelta(hours=Config.REFRESH_WARM_HOURS)
         else:
-            self.logger.info("✅ Nenhuma alteração detectada")
-            
-        return result
-    
-    def combine_and_sort_dataframes(self, df1: pd.DataFrame, df2: pd.DataFrame) -> pd.DataFrame:
-        """Combina dois DataFrames e ordena por data de audiência."""
-        if df1.empty:
-            return df2.copy() if not df2.empty else pd.DataFrame()
-        if df2.empty:
-            return df1.copy()
+            interval = timedelta(hours=Config.REFRESH_COLD_HOURS)
+
+        history = self._state.get(window_key, {})
+        checks = history.get('checks', 0)
+        changes = history.get('changes', 0)
+        if checks >= 3:
+            if changes / checks >= 0.5:
+                interval /= 2
+            elif changes == 0:
+                interval *= 2
+
+        return interval
+
+    def is_due(self, window_key: str, window_start: date) -> bool:
+        """Indica se a janela deve ser consultada novamente no tribunal."""
+        history = self._state.get(window_key)
+        if not history or not history.get('last_fetched'):
+            return True
+
+        last_fetched = datetime.fromisoformat(history['last_fetched'])
+        return datetime.now() - last_fetched >= self.refresh_interval(window_key, window_start)
+
+    def cached_ranges(self, tribunal_name: str) -> List[Tuple[date, date]]:
+        """
+        Períodos do tribunal consultados anteriormente que ainda não venceram.
+        
+        Só entram janelas que começam hoje ou depois, para que as respostas em
+        cache não tragam audiências já passadas.
+        """
+        today = date.today()
+        ranges = []
+        for window_key in list(self._state):
+            parsed = self._parse_key(window_key)
+            if parsed is None or parsed[0] != tribunal_name or parsed[1] < today:
+                continue
+            if not self.is_due(window_key, parsed[1]):
+                ranges.append((parsed[1], parsed[2]))
+        return ranges
+
+    def record(self, window_key: str, content_hash: str) -> None:
+        """Registra uma consulta da janela e se o conteúdo mudou desde a anterior."""
+        with self._lock:
+            history = self._state.setdefault(window_key, {'checks': 0, 'changes': 0})
+
+            if history.get('content_hash') is not None:
+                history['checks'] += 1
+                if history['content_hash'] != content_hash:
+                    history['changes'] += 1
+                # Mantém o histórico recente para que a política se adapte
+                if history['checks'] > 20:
+                    history['checks'] //= 2
+                    history['changes'] //= 2
+
+            history['content_hash'] = content_hash
+            history['last_fetched'] = datetime.now().isoformat()
+
+
+class ConcurrentFetcher:
+    """Executa consultas aos tribunais em paralelo."""
+
+    def __init__(
+        self,
+        max_per_tribunal: Optional[int] = None,
+        logger: Optional[HearingLogger] = None,
+        processor: Optional[HearingDataProcessor] = None
+    ) -> None:
+        """
+        Inicializa o executor.
         
+        O limite de requisições simultâneas por tribunal é aplicado por cada
+        CourtSession; aqui ele apenas dimensiona o pool de threads. Isso permite
+        que uma tarefa dispare sub-consultas paralelas sem risco de bloqueio.
+        O processor fornece a tabela vazia (do backend em uso) das tarefas que falham.
+        """
+        self.max_per_tribunal = max(1, max_per_tribunal or Config.MAX_CONCURRENT_REQUESTS_PER_TRIBUNAL)
+        self.logger = logger or HearingLogger()
+        self.processor = processor or HearingDataProcessor.create(self.logger)
+
+    def _run_task(self, tribunal: str, task: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """Executa uma tarefa isolando falhas para não interromper as demais."""
         try:
-            # Converte datas para datetime para ordenação correta
-            df1_copy = df1.copy()
-            df2_copy = df2.copy()
-            
-            df1_copy['Data da Audiência'] = pd.to_datetime(
-                df1_copy['Data da Audiência'], 
-                format='%d/%m/%Y',
-                errors='coerce'
-            )
-            df2_copy['Data da Audiência'] = pd.to_datetime(
-                df2_copy['Data da Audiência'], 
-                format='%d/%m/%Y',
-                errors='coerce'
-            )
-            
-            # Concatena os DataFrames
-            combined_df = pd.concat([df1_copy, df2_copy], ignore_index=True)
-            
-            # Remove duplicatas (mesmo processo, local, data e hora)
-            combined_df = combined_df.drop_duplicates(
-                subset=['Número do Processo', 'Órgão Julgador', 'Data da Audiência', 'Hora da Audiência'],
-                keep='first'
-            )
-            
-            # Ordena por data
-            combined_df = combined_df.sort_values(by='Data da Audiência')
-            
-            # Converte data de volta para string no formato brasileiro
-            combined_df['Data da Audiência'] = combined_df['Data da Audiência'].dt.strftime('%d/%m/%Y')
-            
-            self.logger.debug(f"✅ DataFrames combinados: {len(combined_df)} registros únicos")
-            return combined_df
-            
+            return task()
         except Exception as e:
-            self.logger.error(f"Erro ao combinar DataFrames: {e}")
-            return pd.DataFrame()
+            self.logger.error(f"❌ Falha em consulta paralela ao {tribunal}: {e}")
+            return self.processor.empty_table()
+
+    def run(
+        self,
+        tasks: List[Tuple[str, Callable[[], pd.DataFrame]]],
+        raise_errors: bool = False
+    ) -> List[pd.DataFrame]:
+        """
+        Executa todas as tarefas em paralelo e devolve os resultados na ordem do plano.
+
+        Args:
+            tasks: Lista de pares (tribunal, função sem argumentos que retorna um DataFrame)
+            raise_errors: Propaga a primeira falha em vez de substituí-la por uma
+                tabela vazia (usado nas sub-janelas, para que uma janela
+                incompleta não seja tratada como consultada)
+
+        Returns:
+            List[pd.DataFrame]: Resultados na mesma ordem das tarefas recebidas
+        """
+        if not tasks:
+            return []
+
+        tribunals = {tribunal for tribunal, _ in tasks}
+        parallel_tribunals = min(len(tribunals), max(1, Config.MAX_PARALLEL_TRIBUNALS))
+        max_workers = min(len(tasks), self.max_per_tribunal * parallel_tribunals)
+        self.logger.info(
+            f"⚡ Executando {len(tasks)} consultas em paralelo "
+            f"({len(tribunals)} tribunais, até {self.max_per_tribunal} por tribunal)"
+        )
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='fetch') as executor:
+            futures = [
+                executor.submit(task) if raise_errors else executor.submit(self._run_task, tribunal, task)
+                for tribunal, task in tasks
+            ]
+            try:
+                return [future.result() for future in futures]
+            except BaseException:
+                # As tarefas que ainda não começaram não são mais necessárias
+                for future in futures:
+                    future.cancel()
+                raise
+
+
+class RunBudgetExceeded(Exception):
+    """Etapa adiada porque o orçamento de tempo da execução se esgotou."""
+
+
+class RunBudget:
+    """Orçamento de tempo de uma execução (RUN_BUDGET_SECONDS; 0 desativa o limite)."""
+
+    def __init__(self, seconds: Optional[int] = None) -> None:
+        """Inicia a contagem do orçamento."""
+        self.seconds = Config.RUN_BUDGET_SECONDS if seconds is None else seconds
+        self.started = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        """Segundos decorridos desde o início da execução."""
+        return time.monotonic() - self.started
+
+    @property
+    def remaining(self) -> Optional[float]:
+        """Segundos restantes, ou None se não houver limite."""
+        if self.seconds <= 0:
+            return None
+        return max(0.0, self.seconds - self.elapsed)
+
+    @property
+    def expired(self) -> bool:
+        """Indica se o orçamento se esgotou."""
+        return self.remaining == 0
+
+    def check(self, stage: str) -> None:
+        """
+        Verifica se ainda há tempo para uma etapa.
+
+        Raises:
+            RunBudgetExceeded: Se o orçamento já se esgotou
+        """
+        if self.expired:
+            raise RunBudgetExceeded(
+                f"{stage} adiada: orçamento de {self.seconds}s esgotado"
+            )
 
 
 class HearingManager:
@@ -1103,171 +4467,515 @@ class HearingManager:
         
         self.notifier = EmailNotifier(logger=self.logger)
         self.services = GoogleServicesManager(logger=self.logger)
-        self.sheets = GoogleSheetsManager(self.services, self.notifier, self.logger)
-        self.calendar = GoogleCalendarManager(self.services, self.notifier, self.logger)
-        self.processor = HearingDataProcessor(self.logger)
+        self.processor = HearingDataProcessor.create(self.logger)
+        self.sheets = GoogleSheetsManager(self.services, self.notifier, self.logger, self.processor)
+        self.calendar = GoogleCalendarManager(self.services, self.notifier, self.logger, self.processor)
+        self.fetcher = ConcurrentFetcher(logger=self.logger, processor=self.processor)
+        self.scheduler = RefreshScheduler(logger=self.logger)
+        if Config.REFRESH_MODE == 'due' and not Config.RESPONSE_CACHE_ENABLED:
+            self.logger.warning(
+                "⚠️ REFRESH_MODE=due requer RESPONSE_CACHE_ENABLED=true; todas as janelas serão consultadas"
+            )
+
+        # Sessões dos tribunais (uma por entrada do registro)
+        self.tribunals = Config.get_tribunals()
+        if not self.tribunals:
+            raise ValueError("Nenhum tribunal configurado. Verifique TRIBUNALS no arquivo .env")
+        self.court_sessions: Dict[str, CourtSession] = {
+            tribunal.name: CourtSession(
+                tribunal.name, self.logger, self.notifier, base_url=tribunal.base_url
+            )
+            for tribunal in self.tribunals
+        }
+        self.keep_alive = SessionKeepAlive(self.court_sessions, logger=self.logger, notifier=self.notifier)
         
-        # Sessões dos tribunais
-        self.trt2_session = CourtSession('TRT2', self.logger, self.notifier)
-        self.trt15_session = CourtSession('TRT15', self.logger, self.notifier)
+        # Janelas não consultadas nesta execução e o motivo
+        self.skipped_windows: List[Tuple[FetchWindow, Exception]] = []
+        self.stale_windows: List[FetchWindow] = []
+        self.budget = RunBudget()
     
     def _authenticate_with_courts(self) -> bool:
-        """Autentica com os sistemas dos tribunais usando login interativo."""
-        self.logger.info("🔐 Iniciando autenticação nos tribunais...")
+        """
+        Autentica com os sistemas dos tribunais usando login interativo.
         
-        # TRT2
-        self.logger.info("\n" + "="*80)
-        self.logger.info("📍 AUTENTICAÇÃO TRT2")
-        self.logger.info("="*80)
-        trt2_success = self.trt2_session.login_interactive(
-            'https://pje.trt2.jus.br/primeirograu/login.seam'
-        )
+        Com SSO_LOGIN_ENABLED, um único login no SSO do PDPJ cobre todos os
+        tribunais do registro; caso contrário, cada tribunal abre o próprio
+        login, até MAX_PARALLEL_LOGINS ao mesmo tempo. O tempo total fica
+        próximo ao do tribunal mais lento, e não à soma de todos.
+        """
+        self.logger.info("🔐 Iniciando autenticação nos tribunais...")
+        started = time.monotonic()
         
-        if not trt2_success:
-            self.logger.error("❌ Falha na autenticação do TRT2")
-            return False
+        if Config.SSO_LOGIN_ENABLED:
+            success = SsoLoginManager(self.logger, self.notifier).login_all(
+                self.tribunals, self.court_sessions
+            )
+            if success:
+                self.logger.info(
+                    f"\n✅ Autenticação concluída com sucesso em {len(self.tribunals)} tribunais"
+                )
+                self._log_login_metrics(time.monotonic() - started)
+            return success
         
-        # TRT15
-        self.logger.info("\n" + "="*80)
-        self.logger.info("📍 AUTENTICAÇÃO TRT15")
-        self.logger.info("="*80)
-        trt15_success = self.trt15_session.login_interactive(
-            'https://pje.trt15.jus.br/primeirograu/login.seam'
-        )
+        # Cada tribunal abre o próprio navegador (lado a lado), em um pool limitado
+        workers = min(len(self.tribunals), max(1, Config.MAX_PARALLEL_LOGINS))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='login') as executor:
+            results = list(executor.map(
+                lambda tribunal: self.court_sessions[tribunal.name].login_interactive(tribunal.login_url),
+                self.tribunals
+            ))
         
-        if not trt15_success:
-            self.logger.error("❌ Falha na autenticação do TRT15")
+        failed = [tribunal.name for tribunal, success in zip(self.tribunals, results) if not success]
+        if failed:
+            self.logger.error(f"❌ Falha na autenticação do {', '.join(failed)}")
             return False
         
-        self.logger.info("\n✅ Autenticação concluída com sucesso em ambos os tribunais")
+        self.logger.info(
+            f"\n✅ Autenticação concluída com sucesso em {len(self.tribunals)} tribunais"
+        )
+        self._log_login_metrics(time.monotonic() - started)
         return True
     
-    def _get_current_hearings(self, court_domain: str, session: CourtSession) -> pd.DataFrame:
-        """Obtém audiências atuais de um tribunal específico."""
+    def _log_login_metrics(self, elapsed: float) -> None:
+        """Resume o método e o tempo de login de cada tribunal."""
+        metrics = [
+            f"{name} {session.login_metrics['segundos']:.2f}s ({session.login_metrics['metodo']})"
+            for name, session in self.court_sessions.items()
+            if session.login_metrics
+        ]
+        self.logger.info(f"⏱️ Tempo de autenticação: {elapsed:.2f}s — {', '.join(metrics)}")
+    
+    def _fetch_window(
+        self,
+        session: CourtSession,
+        api_url: str,
+        start_date: date,
+        end_date: date,
+        prefer_cache: bool = False
+    ) -> pd.DataFrame:
+        """
+        Busca todas as audiências de uma janela de datas.
+        
+        Com PROBE_BEFORE_FETCH, uma sonda de uma única audiência descobre o
+        total da janela: janelas vazias são descartadas e o total define o
+        tamanho das páginas. Se a janela exceder WINDOW_SPLIT_THRESHOLD, ela é
+        dividida recursivamente (ano → semestre → mês) e as sub-janelas são
+        buscadas em paralelo. Caso contrário, todas as páginas são convertidas
+        conforme chegam.
+        """
+        search_start, search_end = start_date.isoformat(), end_date.isoformat()
+        total = None
+
+        if Config.PROBE_BEFORE_FETCH:
+            total = session.probe_hearing_count(
+                api_url, search_start, search_end, prefer_cache=prefer_cache
+            )
+            if total == 0:
+                self.logger.debug(
+                    f"⏭️ Janela {start_date:%d/%m/%Y}–{end_date:%d/%m/%Y} "
+                    f"do {session.tribunal_name} vazia"
+                )
+                return self.processor.empty_table()
+            if total is not None and total >= Config.WINDOW_SPLIT_THRESHOLD:
+                sub_windows = WindowPlanner.split(start_date, end_date)
+                if sub_windows:
+                    return self._fetch_sub_windows(session, api_url, sub_windows, prefer_cache)
+
+        page_size = min(total, Config.HEARINGS_PAGE_SIZE) if total else None
+        pages = session.iter_hearing_pages(
+            api_url,
+            search_start,
+            search_end,
+            results_per_page=page_size,
+            prefer_cache=prefer_cache,
+            total_count=total
+        )
         try:
-            self.logger.info(f"📥 Buscando audiências atuais no {court_domain}...")
-            
-            year = datetime.now().year
-            today = datetime.now().strftime("%Y-%m-%d")
-            
-            api_url = f'https://{court_domain}/pje-comum-api/api/pauta-usuarios-externos'
-            
-            response_json = session.search_hearings(
-                api_url=api_url,
-                search_start_date=today,
-                search_end_date=f'{year}-12-31'
+            first_page = next(pages, None)
+            if first_page is None:
+                return self.processor.empty_table()
+
+            if total is None and WindowPlanner.is_saturated(first_page):
+                sub_windows = WindowPlanner.split(start_date, end_date)
+                if sub_windows:
+                    pages.close()
+                    return self._fetch_sub_windows(session, api_url, sub_windows, prefer_cache)
+
+            frames = [self.processor.json_to_dataframe(first_page)]
+            frames.extend(self.processor.json_to_dataframe(page) for page in pages)
+            return self.processor.concat_tables(frames)
+        finally:
+            pages.close()
+
+    def _fetch_sub_windows(
+        self,
+        session: CourtSession,
+        api_url: str,
+        sub_windows: List[Tuple[date, date]],
+        prefer_cache: bool = False
+    ) -> pd.DataFrame:
+        """Busca em paralelo as sub-janelas de uma janela dividida."""
+        self.logger.info(
+            f"✂️ Janela {sub_windows[0][0]:%d/%m/%Y}–{sub_windows[-1][1]:%d/%m/%Y} do "
+            f"{session.tribunal_name} dividida em {len(sub_windows)} partes"
+        )
+        frames = self.fetcher.run([
+            (
+                session.tribunal_name,
+                partial(self._fetch_window, session, api_url, sub_start, sub_end, prefer_cache)
             )
+            for sub_start, sub_end in sub_windows
+        ], raise_errors=True)
+        return self.processor.concat_tables(frames)
+
+    def _get_window_hearings(self, window: FetchWindow) -> pd.DataFrame:
+        """Obtém as audiências de uma janela de datas de um tribunal."""
+        tribunal = window.tribunal
+        try:
+            self.budget.check(f"Consulta de {window.key}")
+            self.logger.info(f"📥 Buscando audiências ({window.label}) no {tribunal.name}...")
             
-            df = self.processor.json_to_dataframe(response_json)
-            self.logger.info(f"✅ {len(df)} audiências obtidas de {court_domain}")
-            return df
+            df = self._fetch_window(
+                self.court_sessions[tribunal.name],
+                tribunal.api_url,
+                window.start_date,
+                window.end_date,
+                window.prefer_cache
+            )
+            return self._window_fetched(window, df)
             
         except Exception as e:
-            self.logger.error(f"❌ Erro ao obter audiências de {court_domain}: {e}")
-            self.notifier.send(
-                f"Falha ao obter audiências atuais de {court_domain}. Erro: {e}"
-            )
-            return pd.DataFrame()
+            self._window_failed(window, e)
+            return self.processor.empty_table()
     
-    def _get_future_hearings(self, court_domain: str, session: CourtSession, year: int) -> pd.DataFrame:
-        """Obtém audiências futuras de um tribunal específico para um ano específico."""
-        try:
-            self.logger.info(f"📥 Buscando audiências de {year} no {court_domain}...")
-            
-            api_url = f'https://{court_domain}/pje-comum-api/api/pauta-usuarios-externos'
-            
-            response_json = session.search_hearings(
-                api_url=api_url,
-                search_start_date=f'{year}-01-01',
-                search_end_date=f'{year}-12-31'
+    def _window_fetched(self, window: FetchWindow, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Registra a consulta bem-sucedida de uma janela no histórico de atualizações.
+        
+        Janelas servidas (mesmo em parte) de cache vencido com o circuito do
+        tribunal aberto não entram no histórico, para serem consultadas de novo
+        na próxima execução, e são informadas por _report_skipped_windows.
+        """
+        session = self.court_sessions[window.tribunal.name]
+        if session.take_stale_served(window.start_date, window.end_date):
+            self.stale_windows.append(window)
+            self.logger.warning(
+                f"📦 {len(df)} audiências de {window.tribunal.name} ({window.label}) "
+                f"obtidas de cache desatualizado: circuito aberto"
             )
-            
-            df = self.processor.json_to_dataframe(response_json)
-            self.logger.info(f"✅ {len(df)} audiências obtidas de {court_domain} ({year})")
             return df
-            
-        except Exception as e:
-            self.logger.error(f"❌ Erro ao obter audiências futuras de {court_domain}/{year}: {e}")
+        if not window.prefer_cache:
+            self.scheduler.record(window.key, self.processor.content_hash(df))
+        self.logger.info(
+            f"✅ {len(df)} audiências obtidas de {window.tribunal.name} ({window.label})"
+        )
+        return df
+    
+    def _window_failed(self, window: FetchWindow, error: Exception) -> None:
+        """
+        Registra a falha na consulta de uma janela para o resumo da execução.
+        
+        Janelas recusadas pelo disjuntor do tribunal ou adiadas pelo orçamento
+        de tempo não geram um email cada; elas são informadas em conjunto por
+        _report_skipped_windows.
+        """
+        self.skipped_windows.append((window, error))
+        if isinstance(error, CircuitOpenError):
+            self.logger.warning(f"⏭️ Janela {window.key} ignorada: circuito aberto")
+            return
+        if isinstance(error, RunBudgetExceeded):
+            self.logger.warning(f"⏳ Janela {window.key} adiada: orçamento de tempo esgotado")
+            return
+        
+        self.logger.error(
+            f"❌ Erro ao obter audiências de {window.tribunal.name}/{window.label}: {error}"
+        )
+        self.notifier.send(
+            f"Falha ao obter audiências de {window.tribunal.name} ({window.label}). Erro: {error}"
+        )
+
+    def _report_skipped_windows(self) -> None:
+        """
+        Informa no log e por email as janelas que não foram consultadas nesta
+        execução e as que foram servidas de cache desatualizado.
+        """
+        open_circuits = [
+            session.circuit_breaker for session in self.court_sessions.values()
+            if session.circuit_breaker.is_open
+        ]
+        for breaker in open_circuits:
+            self.logger.warning(f"🔌 {breaker.describe()}")
+        
+        stale = sorted(self.stale_windows, key=lambda window: (window.start_date, window.key))
+        if stale:
+            self.logger.warning(f"📦 {len(stale)} janelas servidas de cache desatualizado nesta execução:")
+            for window in stale:
+                self.logger.warning(f"   • {window.key}")
             self.notifier.send(
-                f"Falha ao obter audiências futuras de {court_domain} para {year}. Erro: {e}"
+                "Tribunais indisponíveis: "
+                + ', '.join(sorted({window.tribunal.name for window in stale}))
+                + ".\nJanelas preenchidas com respostas antigas do cache (podem estar desatualizadas):\n"
+                + "\n".join(f"- {window.key}" for window in stale)
             )
-            return pd.DataFrame()
-    
+        
+        if not self.skipped_windows:
+            return
+        
+        skipped = sorted(self.skipped_windows, key=lambda item: (item[0].start_date, item[0].key))
+        self.logger.warning(f"⚠️ {len(skipped)} janelas não consultadas nesta execução:")
+        for window, error in skipped:
+            self.logger.warning(f"   • {window.key}: {error}")
+        
+        deferred = [
+            window for window, error in skipped
+            if isinstance(error, (CircuitOpenError, RunBudgetExceeded))
+        ]
+        if deferred:
+            reasons = []
+            if open_circuits:
+                reasons.append(
+                    "tribunais indisponíveis: "
+                    + ', '.join(breaker.tribunal_name for breaker in open_circuits)
+                )
+            if any(isinstance(error, RunBudgetExceeded) for _, error in skipped):
+                reasons.append(f"orçamento de {self.budget.seconds}s esgotado")
+            self.notifier.send(
+                f"Coleta incompleta nesta execução ({'; '.join(reasons)}).\n"
+                "Janelas não consultadas (mantidas como estavam na planilha):\n"
+                + "\n".join(f"- {window.key}" for window in deferred)
+            )
+
+    def _keep_unfetched_hearings(
+        self,
+        all_hearings: pd.DataFrame,
+        old_hearings: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Mantém as audiências da planilha cujas datas caem em janelas não consultadas.
+        
+        Assim uma execução incompleta grava o que obteve sem apagar da planilha
+        (e do calendário) as audiências que não pôde atualizar.
+        """
+        if not self.skipped_windows or old_hearings.empty:
+            return all_hearings
+        
+        kept = self.processor.select_dates(old_hearings, WindowPlanner.merge([
+            (window.start_date, window.end_date) for window, _ in self.skipped_windows
+        ]))
+        if kept.empty:
+            return all_hearings
+        self.logger.info(f"📌 {len(kept)} audiências de janelas não consultadas mantidas da planilha")
+        return self.processor.combine_dataframes([all_hearings, kept])
+
+    def _plan_fetch_windows(self) -> List[FetchWindow]:
+        """
+        Monta a lista de janelas (tribunal, período) de todos os tribunais do registro.
+        
+        O horizonte (hoje até o fim do último ano de FUTURE_YEARS) é coberto
+        por janelas disjuntas, sem sobreposição entre elas: a janela prioritária
+        ('proximos', de hoje ao fim da quinzena que contém os próximos
+        PRIORITY_DAYS dias), o restante do ano corrente e cada ano futuro. As
+        janelas são ordenadas por data, para que as audiências mais próximas de
+        todos os tribunais sejam consultadas primeiro.
+        
+        No modo REFRESH_MODE=due, os períodos já consultados que ainda não
+        venceram pela política do RefreshScheduler são reaproveitados com os
+        mesmos limites e servidos do cache de respostas; apenas os intervalos
+        restantes são consultados no tribunal.
+        """
+        today = date.today()
+        horizon_end = date(today.year + Config.FUTURE_YEARS, 12, 31)
+        priority_end = WindowPlanner.half_month_end(
+            today + timedelta(days=max(1, Config.PRIORITY_DAYS) - 1)
+        )
+        boundaries = [priority_end] + [
+            date(year, 12, 31) for year in range(today.year, horizon_end.year + 1)
+        ]
+        due_only = Config.REFRESH_MODE == 'due' and Config.RESPONSE_CACHE_ENABLED
+        windows: List[FetchWindow] = []
+        cached_count = 0
+
+        for tribunal in self.tribunals:
+            cached = self.scheduler.cached_ranges(tribunal.name) if due_only else []
+            for start, end, from_cache in WindowPlanner.plan(today, horizon_end, boundaries, cached):
+                if start == today:
+                    label = 'proximos'
+                else:
+                    label = 'atual' if start.year == today.year else str(start.year)
+                windows.append(FetchWindow(tribunal, label, start, end, prefer_cache=from_cache))
+                cached_count += from_cache
+
+        windows.sort(key=lambda window: window.start_date)
+        if due_only:
+            self.logger.info(
+                f"🗓️ {len(windows) - cached_count} janelas vencidas serão consultadas; "
+                f"{cached_count} servidas do cache"
+            )
+        return windows
+
+    def _build_fetch_tasks(
+        self,
+        windows: List[FetchWindow]
+    ) -> List[Tuple[str, Callable[[], pd.DataFrame]]]:
+        """Converte as janelas planejadas em tarefas para o ConcurrentFetcher."""
+        return [
+            (window.tribunal.name, partial(self._get_window_hearings, window))
+            for window in windows
+        ]
+
+    async def _fetch_window_async(
+        self,
+        client: AsyncCourtClient,
+        api_url: str,
+        start_date: date,
+        end_date: date,
+        prefer_cache: bool = False
+    ) -> pd.DataFrame:
+        """
+        Versão assíncrona de _fetch_window.
+        
+        A divisão de janelas depende do total informado pela sonda; sem ele,
+        a janela é paginada por completo.
+        """
+        search_start, search_end = start_date.isoformat(), end_date.isoformat()
+        total = None
+
+        if Config.PROBE_BEFORE_FETCH:
+            total = await client.probe_hearing_count(
+                api_url, search_start, search_end, prefer_cache=prefer_cache
+            )
+            if total == 0:
+                return self.processor.empty_table()
+            if total is not None and total >= Config.WINDOW_SPLIT_THRESHOLD:
+                sub_windows = WindowPlanner.split(start_date, end_date)
+                if sub_windows:
+                    self.logger.info(
+                        f"✂️ Janela {start_date:%d/%m/%Y}–{end_date:%d/%m/%Y} do "
+                        f"{client.tribunal_name} dividida em {len(sub_windows)} partes"
+                    )
+                    frames = await AsyncCourtClient.gather(*(
+                        self._fetch_window_async(client, api_url, sub_start, sub_end, prefer_cache)
+                        for sub_start, sub_end in sub_windows
+                    ))
+                    return self.processor.concat_tables(frames)
+
+        pages = await client.fetch_hearing_pages(
+            api_url,
+            search_start,
+            search_end,
+            results_per_page=min(total, Config.HEARINGS_PAGE_SIZE) if total else None,
+            prefer_cache=prefer_cache,
+            total_count=total
+        )
+        return self.processor.concat_tables([self.processor.json_to_dataframe(page) for page in pages])
+
+    async def _get_window_hearings_async(
+        self,
+        client: AsyncCourtClient,
+        window: FetchWindow
+    ) -> pd.DataFrame:
+        """Versão assíncrona de _get_window_hearings."""
+        try:
+            self.budget.check(f"Consulta de {window.key}")
+            self.logger.info(f"📥 Buscando audiências ({window.label}) no {window.tribunal.name}...")
+            df = await self._fetch_window_async(
+                client, window.tribunal.api_url, window.start_date, window.end_date,
+                window.prefer_cache
+            )
+            return self._window_fetched(window, df)
+        except Exception as e:
+            await asyncio.to_thread(self._window_failed, window, e)
+            return self.processor.empty_table()
+
+    async def _fetch_all_windows_async(self, windows: List[FetchWindow]) -> List[pd.DataFrame]:
+        """Consulta todas as janelas em um único event loop, com um cliente por tribunal."""
+        async with AsyncExitStack() as stack:
+            clients: Dict[str, AsyncCourtClient] = {}
+            for window in windows:
+                name = window.tribunal.name
+                if name not in clients:
+                    clients[name] = await stack.enter_async_context(
+                        AsyncCourtClient(self.court_sessions[name])
+                    )
+
+            self.logger.info(f"⚡ Executando {len(windows)} consultas assíncronas")
+            return list(await asyncio.gather(*(
+                self._get_window_hearings_async(clients[window.tribunal.name], window)
+                for window in windows
+            )))
+
+    def _fetch_all_windows(self, windows: List[FetchWindow]) -> List[pd.DataFrame]:
+        """Consulta todas as janelas usando o backend HTTP configurado (threads ou async)."""
+        if Config.HTTP_BACKEND == 'async':
+            if aiohttp is not None:
+                return asyncio.run(self._fetch_all_windows_async(windows))
+            self.logger.warning("⚠️ aiohttp não instalado; usando backend com threads")
+        return self.fetcher.run(self._build_fetch_tasks(windows))
+
     def process_hearings(self) -> None:
         """Processo principal de obtenção e processamento de audiências."""
         start_time = time.time()
+        self.budget = RunBudget()
+        for session in self.court_sessions.values():
+            session.budget = self.budget
         self.logger.info("🏁 Iniciando rotina de processamento de audiências...")
+        if self.budget.remaining is not None:
+            self.logger.info(f"⏳ Orçamento de tempo da execução: {self.budget.seconds} segundos")
         
         try:
             # 1. Autenticação com os tribunais
             if not self._authenticate_with_courts():
                 self.logger.critical("❌ Falha na autenticação. Encerrando processamento.")
                 return
+            self.keep_alive.start()
             
-            # 2. Obtenção de audiências atuais
+            # 2. Obtenção de audiências atuais e futuras (consultas em paralelo)
             self.logger.info("\n" + "="*80)
-            self.logger.info("📊 FASE 1: COLETA DE AUDIÊNCIAS ATUAIS")
+            self.logger.info("📊 FASES 1 E 2: COLETA DE AUDIÊNCIAS ATUAIS E FUTURAS")
             self.logger.info("="*80)
-            
-            trt2_hearings = self._get_current_hearings('pje.trt2.jus.br', self.trt2_session)
-            trt15_hearings = self._get_current_hearings('pje.trt15.jus.br', self.trt15_session)
-            
-            # 3. Combinação das audiências atuais
-            current_hearings = self.processor.combine_and_sort_dataframes(
-                trt2_hearings, trt15_hearings
-            )
-            self.logger.info(f"📊 Total de audiências atuais: {len(current_hearings)}")
-            
-            # 4. Obtenção de audiências futuras
-            self.logger.info("\n" + "="*80)
-            self.logger.info("📊 FASE 2: COLETA DE AUDIÊNCIAS FUTURAS")
-            self.logger.info("="*80)
-            
-            current_year = datetime.now().year
-            all_hearings = current_hearings.copy()
-            
-            # Busca audiências para os próximos 3 anos
-            for year in range(current_year + 1, current_year + 4):
-                self.logger.info(f"\n📅 Processando ano: {year}")
-                
-                # TRT2
-                future_trt2 = self._get_future_hearings('pje.trt2.jus.br', self.trt2_session, year)
-                all_hearings = self.processor.combine_and_sort_dataframes(
-                    all_hearings, future_trt2
-                )
-                
-                # TRT15
-                future_trt15 = self._get_future_hearings('pje.trt15.jus.br', self.trt15_session, year)
-                all_hearings = self.processor.combine_and_sort_dataframes(
-                    all_hearings, future_trt15
-                )
-            
+
+            fetch_start = time.time()
+            self.skipped_windows = []
+            self.stale_windows = []
+            results = self._fetch_all_windows(self._plan_fetch_windows())
+            for session in self.court_sessions.values():
+                self.logger.info(f"🚦 {session.rate_limiter.describe()}")
+            self._report_skipped_windows()
+            self.scheduler.save()
+            self.logger.info(f"⏱️  Coleta concluída em {time.time() - fetch_start:.2f} segundos")
+
+            # 3. Combinação de todos os resultados
+            all_hearings = self.processor.combine_dataframes(results)
+
             self.logger.info(f"\n📊 Total geral de audiências: {len(all_hearings)}")
             
-            # 5. Identificação de audiências com alterações
+            # 4. Identificação de audiências com alterações
             self.logger.info("\n" + "="*80)
             self.logger.info("📊 FASE 3: DETECÇÃO DE ALTERAÇÕES")
             self.logger.info("="*80)
             
             old_hearings = self.sheets.read_from_sheet(Config.ACTUAL_HEARING_SPREADSHEET_ID)
+            all_hearings = self._keep_unfetched_hearings(all_hearings, old_hearings)
             changed_hearings = self.processor.find_changed_hearings(all_hearings, old_hearings)
             
             if not changed_hearings.empty:
+                # Alterações mais próximas primeiro
+                changed_hearings = self.processor.sort_by_date(changed_hearings)
                 self.logger.info(f"⚠️ Detectadas {len(changed_hearings)} audiências com alterações")
                 self.sheets.append_to_sheet(changed_hearings, Config.CHANGED_HEARING_SPREADSHEET_ID)
                 self.calendar.handle_changed_events(changed_hearings, Config.CALENDAR_ID)
             else:
                 self.logger.info("✅ Nenhuma alteração detectada")
             
-            # 6. Atualização da planilha principal
+            # 5. Atualização da planilha principal
             self.logger.info("\n" + "="*80)
             self.logger.info("📊 FASE 4: ATUALIZAÇÃO DE PLANILHAS E CALENDÁRIO")
             self.logger.info("="*80)
             
             self.sheets.write_to_sheet(all_hearings, Config.ACTUAL_HEARING_SPREADSHEET_ID)
             
-            # 7. Atualização do calendário
-            self.calendar.populate_calendar(all_hearings, Config.CALENDAR_ID)
+            # 6. Atualização do calendário
+            self.calendar.populate_calendar(all_hearings, Config.CALENDAR_ID, budget=self.budget)
             
             # Finalização
             elapsed_time = time.time() - start_time
@@ -1280,10 +4988,41 @@ class HearingManager:
             self.logger.critical(f"❌ Erro crítico no processamento: {e}")
             self.notifier.send(f"ERRO CRÍTICO no processamento de audiências: {e}")
             raise
+        finally:
+            self.keep_alive.stop()
+
+
+def run_keep_alive() -> None:
+    """
+    Mantém as sessões dos tribunais ativas entre as execuções agendadas.
+    
+    Uso: python scrapper_refactored.py --keep-alive
+    """
+    logger = HearingLogger()
+    notifier = EmailNotifier(logger=logger)
+    sessions = {}
+    for tribunal in Config.get_tribunals():
+        session = CourtSession(tribunal.name, logger, notifier, base_url=tribunal.base_url)
+        if session.restore_cached_session() or session.refresh_session():
+            sessions[tribunal.name] = session
+        else:
+            logger.warning(
+                f"⚠️ Nenhuma sessão ativa para {tribunal.name}; execute a rotina normal para fazer login"
+            )
+    
+    if not sessions:
+        logger.error("❌ Nenhuma sessão ativa para manter")
+        return
+    
+    SessionKeepAlive(sessions, logger=logger, notifier=notifier).run_forever()
 
 
 def main() -> None:
     """Função principal de execução do programa."""
+    if '--keep-alive' in sys.argv[1:]:
+        run_keep_alive()
+        return
+    
     try:
         manager = HearingManager()
         manager.process_hearings()